@@ -4,10 +4,19 @@ safe-cli: Know before you run
 A safety wrapper for dangerous shell commands.
 """
 
+from typing import Any
+
 __version__ = "0.1.0"
 __author__ = "Jefferson Njau"
 __license__ = "MIT"
 
-from safe_cli.cli import app
-
 __all__ = ["app", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the CLI app on first access to keep package import cheap."""
+    if name == "app":
+        from safe_cli.cli import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,29 +5,23 @@ CLI entry point for safe-cli.
 from typing import List, Optional
 
 import typer
-from rich.console import Console
 
 from safe_cli import __version__
-from safe_cli.core.analyzer import CommandAnalyzer
-from safe_cli.core.executor import CommandExecutor
-from safe_cli.core.parser import CommandParser
-from safe_cli.ui.display import DisplayFormatter
-from safe_cli.ui.prompts import PromptResponse, UserPrompt
+
+# Rich and the analysis stack are imported inside main() so that --version
+# and --help don't pay for them
 
 app = typer.Typer(
     name="safe",
     help="Know before you run - A safety wrapper for dangerous shell commands",
     add_completion=False,
 )
-console = Console()
 
 
 def version_callback(value: bool) -> None:
     """Show version and exit."""
     if value:
-        console.print(
-            f"[bold blue]safe-cli[/bold blue] version [green]{__version__}[/green]"
-        )
+        typer.echo(f"safe-cli version {__version__}")
         raise typer.Exit()
 
 
@@ -67,6 +61,10 @@ def main(
         safe --dry-run git reset --hard
         safe --yes mv file.txt backup/
     """
+    from rich.console import Console
+
+    console = Console()
+
     # If no command provided, show help
     if not command:
         console.print("[yellow]No command provided.[/yellow]")
@@ -78,8 +76,13 @@ def main(
         console.print("\nRun [bold]safe --help[/bold] for more information.")
         raise typer.Exit(1)
 
+    from safe_cli.core.analyzer import CommandAnalyzer
+    from safe_cli.core.executor import CommandExecutor
+    from safe_cli.core.parser import CommandParser
+    from safe_cli.ui.display import DisplayFormatter
+    from safe_cli.ui.prompts import PromptResponse, UserPrompt
+
     # Initialize components
-    command_str = " ".join(command)
     parser = CommandParser()
     analyzer = CommandAnalyzer()
     display = DisplayFormatter(console)
@@ -87,8 +90,13 @@ def main(
     executor = CommandExecutor()
 
     try:
-        # Parse command
-        parsed = parser.parse(command_str)
+        # Parse command. The shell has already split argv for us; a single
+        # argument is taken as a full command line (e.g. safe "ls | wc -l")
+        if len(command) == 1:
+            parsed = parser.parse(command[0])
+        else:
+            parsed = parser.parse_tokens(command)
+        command_str = parsed.raw
 
         # Analyze for risks
         result = analyzer.analyze(parsed)
@@ -119,7 +127,7 @@ def main(
                     console.print()
                     display.display_comparison(command_str, chosen)
                     display.display_execution_start(chosen)
-                    exec_result = executor.execute(chosen)
+                    exec_result = executor.execute(chosen, capture=False)
                 elif use_alt is False and chosen is None:
                     # User chose to abort
                     display.display_execution_aborted()
@@ -127,22 +135,16 @@ def main(
                 else:
                     # User chose original (shouldn't happen, but handle it)
                     display.display_execution_start(command_str)
-                    exec_result = executor.execute(command_str)
+                    exec_result = executor.execute(command_str, capture=False)
             else:
                 # No alternatives available (shouldn't reach here)
                 display.display_execution_start(command_str)
-                exec_result = executor.execute(command_str)
+                exec_result = executor.execute(command_str, capture=False)
 
         else:  # PromptResponse.CONTINUE
             # Execute original command
             display.display_execution_start(command_str)
-            exec_result = executor.execute(command_str)
-
-        # Display execution results
-        if exec_result.stdout:
-            console.print(exec_result.stdout, end="")
-        if exec_result.stderr:
-            console.print(f"[red]{exec_result.stderr}[/red]", end="")
+            exec_result = executor.execute(command_str, capture=False)
 
         # Show completion status
         display.display_execution_complete(exec_result.success)
@@ -2,9 +2,19 @@
 Core functionality for safe-cli.
 """
 
-from safe_cli.core.analyzer import AnalysisResult, CommandAnalyzer
-from safe_cli.core.parser import CommandParser, ParsedCommand
-from safe_cli.core.suggestion import SafeAlternativeGenerator
+from importlib import import_module
+from typing import Any
+
+# Exports are resolved on first access, so importing one submodule (e.g. the
+# parser, which every rule module needs) doesn't pull in the analyzer and,
+# through it, the rules package that may still be initializing
+_EXPORTS = {
+    "CommandParser": "safe_cli.core.parser",
+    "ParsedCommand": "safe_cli.core.parser",
+    "CommandAnalyzer": "safe_cli.core.analyzer",
+    "AnalysisResult": "safe_cli.core.analyzer",
+    "SafeAlternativeGenerator": "safe_cli.core.suggestion",
+}
 
 __all__ = [
     "CommandParser",
@@ -13,3 +23,11 @@ __all__ = [
     "AnalysisResult",
     "SafeAlternativeGenerator",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import core exports on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
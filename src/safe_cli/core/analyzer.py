@@ -2,26 +2,45 @@
 Command analyzer for safety assessment.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from functools import cached_property, lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from safe_cli.core.parser import ParsedCommand
 from safe_cli.rules.base import RuleMatch
 from safe_cli.rules.registry import RuleRegistry
 from safe_cli.utils.constants import DangerLevel
 
+# Longer command strings are analyzed every time so that the cache's memory
+# stays bounded by cache_size entries of ordinary length
+_CACHEABLE_MAX_LENGTH = 4096
 
-@dataclass
+# Shared by every safe result; empty tuples are singletons too, so a safe
+# result allocates nothing beyond itself
+_NO_CONCERNS = "No safety concerns detected."
+
+# Smallest batch worth the cost of starting worker processes
+_PARALLEL_BATCH_MIN = 32
+
+
+@dataclass(frozen=True)
 class AnalysisResult:
     """Result of command analysis."""
 
     command: ParsedCommand
     danger_level: DangerLevel
-    matches: List[RuleMatch]
+    matches: Tuple[RuleMatch, ...]
     primary_warning: str
-    all_warnings: List[str]
-    suggestions: List[str]
-    safe_alternatives: List[str]
+    all_warnings: Tuple[str, ...]
+    suggestions: Tuple[str, ...]
+    safe_alternatives: Tuple[str, ...]
+
+    @cached_property
+    def additional_warnings(self) -> Tuple[str, ...]:
+        """Warnings after the primary one, sliced once for display."""
+        return self.all_warnings[1:]
 
     @property
     def is_safe(self) -> bool:
@@ -44,17 +63,43 @@ class AnalysisResult:
         return len(self.safe_alternatives) > 0
 
 
+@lru_cache(maxsize=1)
+def _default_registry() -> RuleRegistry:
+    """
+    Get the process-wide default rule registry.
+
+    The registry is built on first use and shared by every analyzer that
+    isn't given an explicit registry, so rule setup is paid once per process.
+
+    Returns:
+        Shared default RuleRegistry
+    """
+    return RuleRegistry()
+
+
+def preload() -> None:
+    """Build the default rule registry ahead of the first analysis."""
+    _default_registry()
+
+
 class CommandAnalyzer:
     """Analyzes commands for safety risks."""
 
-    def __init__(self, registry: Optional[RuleRegistry] = None) -> None:
+    def __init__(
+        self, registry: Optional[RuleRegistry] = None, cache_size: int = 256
+    ) -> None:
         """
         Initialize analyzer.
 
         Args:
-            registry: Rule registry to use. Creates default if None.
+            registry: Rule registry to use. Uses the shared default if None.
+            cache_size: Number of recent commands whose rule matches are
+                remembered. Use 0 to disable caching.
         """
-        self.registry = registry if registry else RuleRegistry()
+        self.registry = registry if registry is not None else _default_registry()
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, Tuple[RuleMatch, ...]] = OrderedDict()
+        self._cache_version = self.registry.version
 
     def analyze(self, command: ParsedCommand) -> AnalysisResult:
         """
@@ -66,21 +111,26 @@ class CommandAnalyzer:
         Returns:
             AnalysisResult with aggregated warnings and suggestions
         """
+        # Most commands aren't covered by any rule
+        if not self.registry.has_candidates(command.command):
+            return self._create_safe_result(command)
+
         # Get all matching rules
-        matches = self.registry.analyze_command(command)
+        matches = self._match_rules(command)
 
         # If no matches, command is safe
         if not matches:
             return self._create_safe_result(command)
 
-        # Get highest danger level
-        danger_level = max(match.danger_level for match in matches)
-
-        # Aggregate warnings, suggestions, and alternatives
-        primary_warning = self._get_primary_warning(matches, danger_level)
-        all_warnings = self._aggregate_warnings(matches)
-        suggestions = self._aggregate_suggestions(matches)
-        safe_alternatives = self._aggregate_safe_alternatives(matches)
+        # Highest danger level, primary warning and unique messages
+        # are all collected in one pass
+        (
+            danger_level,
+            primary_warning,
+            all_warnings,
+            suggestions,
+            safe_alternatives,
+        ) = self._aggregate(matches)
 
         return AnalysisResult(
             command=command,
@@ -92,112 +142,120 @@ class CommandAnalyzer:
             safe_alternatives=safe_alternatives,
         )
 
-    def _create_safe_result(self, command: ParsedCommand) -> AnalysisResult:
-        """Create a safe analysis result."""
-        return AnalysisResult(
-            command=command,
-            danger_level=DangerLevel.SAFE,
-            matches=[],
-            primary_warning="No safety concerns detected.",
-            all_warnings=[],
-            suggestions=[],
-            safe_alternatives=[],
-        )
-
-    def _get_primary_warning(
-        self, matches: List[RuleMatch], danger_level: DangerLevel
-    ) -> str:
+    def _match_rules(self, command: ParsedCommand) -> Tuple[RuleMatch, ...]:
         """
-        Get the primary warning message.
+        Get rule matches for a command, reusing earlier results for the same
+        command string.
 
         Args:
-            matches: List of rule matches
-            danger_level: Highest danger level
+            command: Parsed command to analyze
 
         Returns:
-            Primary warning message
-        """
-        # Find the match with the highest danger level
-        primary_match = max(matches, key=lambda m: m.danger_level)
-        return primary_match.message
-
-    def _aggregate_warnings(self, matches: List[RuleMatch]) -> List[str]:
+            Tuple of rule matches
         """
-        Aggregate all warning messages.
+        raw = command.raw
+        if self.cache_size <= 0 or len(raw) > _CACHEABLE_MAX_LENGTH:
+            return tuple(self.registry.analyze_command(command))
+
+        # Drop everything if rules were added or removed since caching
+        if self._cache_version != self.registry.version:
+            self._cache.clear()
+            self._cache_version = self.registry.version
+
+        cached = self._cache.get(raw)
+        if cached is not None:
+            self._cache.move_to_end(raw)
+            return cached
+
+        matches = tuple(self.registry.analyze_command(command))
+        self._cache[raw] = matches
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return matches
+
+    def clear_cache(self) -> None:
+        """Forget all remembered analysis results."""
+        self._cache.clear()
 
-        Args:
-            matches: List of rule matches
+    def _create_safe_result(self, command: ParsedCommand) -> AnalysisResult:
+        """Create a safe analysis result."""
+        return AnalysisResult(
+            command=command,
+            danger_level=DangerLevel.SAFE,
+            matches=(),
+            primary_warning=_NO_CONCERNS,
+            all_warnings=(),
+            suggestions=(),
+            safe_alternatives=(),
+        )
 
-        Returns:
-            List of unique warning messages
-        """
-        warnings = [match.message for match in matches]
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_warnings = []
-        for warning in warnings:
-            if warning not in seen:
-                seen.add(warning)
-                unique_warnings.append(warning)
-        return unique_warnings
-
-    def _aggregate_suggestions(self, matches: List[RuleMatch]) -> List[str]:
+    def _aggregate(
+        self, matches: Tuple[RuleMatch, ...]
+    ) -> Tuple[DangerLevel, str, Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
         """
-        Aggregate all suggestions.
+        Aggregate rule matches in a single pass.
 
         Args:
-            matches: List of rule matches
+            matches: Non-empty tuple of rule matches
 
         Returns:
-            List of unique suggestions
+            Tuple of (highest danger level, primary warning, unique warnings,
+            unique suggestions, unique safe alternatives). The primary warning
+            comes from the first match with the highest danger level.
         """
-        suggestions = [
-            match.suggestion for match in matches if match.suggestion is not None
-        ]
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_suggestions = []
-        for suggestion in suggestions:
-            if suggestion not in seen:
-                seen.add(suggestion)
-                unique_suggestions.append(suggestion)
-        return unique_suggestions
-
-    def _aggregate_safe_alternatives(self, matches: List[RuleMatch]) -> List[str]:
-        """
-        Aggregate safe alternative commands.
-
-        Args:
-            matches: List of rule matches
+        # Dicts keep insertion order, so they double as ordered sets
+        warnings: Dict[str, None] = {}
+        suggestions: Dict[str, None] = {}
+        alternatives: Dict[str, None] = {}
+
+        primary = matches[0]
+        for match in matches:
+            if match.danger_level > primary.danger_level:
+                primary = match
+            warnings[match.message] = None
+            if match.suggestion is not None:
+                suggestions[match.suggestion] = None
+            if match.safe_alternative is not None:
+                alternatives[match.safe_alternative] = None
+
+        return (
+            primary.danger_level,
+            primary.message,
+            tuple(warnings),
+            tuple(suggestions),
+            tuple(alternatives),
+        )
 
-        Returns:
-            List of unique safe alternatives
-        """
-        alternatives = [
-            match.safe_alternative
-            for match in matches
-            if match.safe_alternative is not None
-        ]
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_alternatives = []
-        for alternative in alternatives:
-            if alternative not in seen:
-                seen.add(alternative)
-                unique_alternatives.append(alternative)
-        return unique_alternatives
-
-    def analyze_batch(self, commands: List[ParsedCommand]) -> List[AnalysisResult]:
+    def analyze_batch(
+        self, commands: List[ParsedCommand], workers: Optional[int] = None
+    ) -> List[AnalysisResult]:
         """
         Analyze multiple commands.
 
         Args:
             commands: List of parsed commands
+            workers: Number of worker processes to spread a large batch over.
+                Only used with the default registry, since workers build
+                their own copy of it; None or 1 analyzes in this process.
 
         Returns:
             List of analysis results
         """
-        return [self.analyze(cmd) for cmd in commands]
+        if (
+            workers is None
+            or workers <= 1
+            or len(commands) < _PARALLEL_BATCH_MIN
+            or self.registry is not _default_registry()
+        ):
+            return [self.analyze(cmd) for cmd in commands]
+
+        chunksize = max(1, len(commands) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            results = pool.map(_analyze_in_worker, commands, chunksize=chunksize)
+            # Hand back the caller's command objects rather than pickled copies
+            return [
+                replace(result, command=cmd) for cmd, result in zip(commands, results)
+            ]
 
     def get_summary(self, result: AnalysisResult) -> str:
         """
@@ -216,10 +274,10 @@ class CommandAnalyzer:
             f"Primary Warning: {result.primary_warning}",
         ]
 
-        if len(result.all_warnings) > 1:
+        if result.additional_warnings:
             lines.append("")
             lines.append("Additional Warnings:")
-            for i, warning in enumerate(result.all_warnings[1:], 1):
+            for i, warning in enumerate(result.additional_warnings, 1):
                 lines.append(f"  {i}. {warning}")
 
         if result.suggestions:
@@ -235,3 +293,19 @@ class CommandAnalyzer:
                 lines.append(f"  {i}. {alt}")
 
         return "\n".join(lines)
+
+
+# Analyzer owned by a batch worker process, set up by _init_worker
+_worker_analyzer: Optional[CommandAnalyzer] = None
+
+
+def _init_worker() -> None:
+    """Build the default registry and an analyzer once per worker process."""
+    global _worker_analyzer
+    _worker_analyzer = CommandAnalyzer()
+
+
+def _analyze_in_worker(command: ParsedCommand) -> AnalysisResult:
+    """Analyze one command inside a batch worker process."""
+    assert _worker_analyzer is not None
+    return _worker_analyzer.analyze(command)
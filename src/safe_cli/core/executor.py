@@ -2,12 +2,22 @@
 Safe command execution.
 """
 
+import codecs
+import locale
+import os
+import selectors
 import subprocess
+import sys
+import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, List, Optional, TextIO
 
+# select() only accepts pipes on POSIX; elsewhere realtime output falls back
+# to collecting everything when the command finishes
+_CAN_SELECT_PIPES = os.name == "posix"
 
-@dataclass
+
+@dataclass(frozen=True)
 class ExecutionResult:
     """Result of command execution."""
 
@@ -41,23 +51,29 @@ class CommandExecutor:
         """
         self.shell = shell
 
-    def execute(self, command: str, timeout: Optional[int] = None) -> ExecutionResult:
+    def execute(
+        self, command: str, timeout: Optional[int] = None, capture: bool = True
+    ) -> ExecutionResult:
         """
         Execute a command safely.
 
         Args:
             command: Command string to execute
             timeout: Timeout in seconds (None for no timeout)
+            capture: Whether to collect stdout/stderr. When False the command
+                inherits our stdio and the result carries no output.
 
         Returns:
             ExecutionResult with command output and status
         """
+        stream = subprocess.PIPE if capture else None
         try:
             # Execute command
             result = subprocess.run(
                 command,
                 shell=self.shell,
-                capture_output=True,
+                stdout=stream,
+                stderr=stream,
                 text=True,
                 timeout=timeout,
             )
@@ -66,8 +82,8 @@ class CommandExecutor:
                 command=command,
                 success=result.returncode == 0,
                 return_code=result.returncode,
-                stdout=result.stdout,
-                stderr=result.stderr,
+                stdout=result.stdout or "",
+                stderr=result.stderr or "",
             )
 
         except subprocess.TimeoutExpired as e:
@@ -96,6 +112,9 @@ class CommandExecutor:
         """
         Execute command with real-time output streaming.
 
+        Output is echoed to our stdout/stderr as it arrives and also
+        collected into the result.
+
         Args:
             command: Command to execute
             timeout: Timeout in seconds
@@ -103,40 +122,22 @@ class CommandExecutor:
         Returns:
             ExecutionResult with final status
         """
+        process = None
         try:
-            # Execute with stdout/stderr streaming
             process = subprocess.Popen(
                 command,
                 shell=self.shell,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-            )
-
-            # Wait for completion
-            stdout, stderr = process.communicate(timeout=timeout)
-
-            return ExecutionResult(
-                command=command,
-                success=process.returncode == 0,
-                return_code=process.returncode,
-                stdout=stdout,
-                stderr=stderr,
-            )
-
-        except subprocess.TimeoutExpired:
-            process.kill()
-            stdout, stderr = process.communicate()
-            return ExecutionResult(
-                command=command,
-                success=False,
-                return_code=-1,
-                stdout=stdout,
-                stderr=stderr,
-                error=f"Command timed out after {timeout} seconds",
             )
+            if not _CAN_SELECT_PIPES:
+                return _communicate(command, process, timeout)
+            return _stream(command, process, timeout)
 
         except Exception as e:
+            if process is not None:
+                process.kill()
+                process.wait()
             return ExecutionResult(
                 command=command,
                 success=False,
@@ -163,3 +164,117 @@ class CommandExecutor:
             stdout=f"[DRY RUN] Would execute: {command}",
             stderr="",
         )
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left until deadline, or None when there is no deadline."""
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def _decode(data: bytes) -> str:
+    """Decode process output the way text-mode pipes would."""
+    return data.decode(locale.getpreferredencoding(False), errors="replace")
+
+
+def _timed_out_result(
+    command: str, timeout: Optional[int], stdout: str, stderr: str
+) -> ExecutionResult:
+    """Build the result for a command killed at its timeout."""
+    return ExecutionResult(
+        command=command,
+        success=False,
+        return_code=-1,
+        stdout=stdout,
+        stderr=stderr,
+        error=f"Command timed out after {timeout} seconds",
+    )
+
+
+def _communicate(
+    command: str, process: "subprocess.Popen[bytes]", timeout: Optional[int]
+) -> ExecutionResult:
+    """
+    Wait for a process and collect its output without echoing it.
+
+    Used where pipes can't be passed to select(), so output is only
+    available once the command has finished.
+    """
+    try:
+        stdout, stderr = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired as e:
+        # Keep what arrived before the timeout; draining the pipes could block
+        # on children of the shell that still hold them open
+        process.kill()
+        process.wait()
+        assert process.stdout is not None and process.stderr is not None
+        process.stdout.close()
+        process.stderr.close()
+        return _timed_out_result(
+            command, timeout, _decode(e.stdout or b""), _decode(e.stderr or b"")
+        )
+
+    return ExecutionResult(
+        command=command,
+        success=process.returncode == 0,
+        return_code=process.returncode,
+        stdout=_decode(stdout),
+        stderr=_decode(stderr),
+    )
+
+
+def _stream(
+    command: str, process: "subprocess.Popen[bytes]", timeout: Optional[int]
+) -> ExecutionResult:
+    """Echo a process's output as it arrives while also collecting it."""
+    assert process.stdout is not None and process.stderr is not None
+    out_fd, err_fd = process.stdout.fileno(), process.stderr.fileno()
+    sinks: Dict[int, TextIO] = {out_fd: sys.stdout, err_fd: sys.stderr}
+    encoding = locale.getpreferredencoding(False)
+    decoders = {
+        fd: codecs.getincrementaldecoder(encoding)(errors="replace") for fd in sinks
+    }
+    collected: Dict[int, List[str]] = {fd: [] for fd in sinks}
+    deadline = None if timeout is None else time.monotonic() + timeout
+    timed_out = False
+
+    with selectors.DefaultSelector() as selector:
+        for fd in sinks:
+            selector.register(fd, selectors.EVENT_READ)
+
+        while selector.get_map():
+            remaining = _remaining(deadline)
+            if remaining is not None and remaining <= 0:
+                timed_out = True
+                break
+            for key, _ in selector.select(remaining):
+                data = os.read(key.fd, 65536)
+                text = decoders[key.fd].decode(data, final=not data)
+                if text:
+                    collected[key.fd].append(text)
+                    sinks[key.fd].write(text)
+                    sinks[key.fd].flush()
+                if not data:
+                    selector.unregister(key.fd)
+
+    if not timed_out:
+        try:
+            process.wait(timeout=_remaining(deadline))
+        except subprocess.TimeoutExpired:
+            timed_out = True
+
+    if timed_out:
+        process.kill()
+        process.wait()
+    process.stdout.close()
+    process.stderr.close()
+
+    stdout, stderr = "".join(collected[out_fd]), "".join(collected[err_fd])
+    if timed_out:
+        return _timed_out_result(command, timeout, stdout, stderr)
+    return ExecutionResult(
+        command=command,
+        success=process.returncode == 0,
+        return_code=process.returncode,
+        stdout=stdout,
+        stderr=stderr,
+    )
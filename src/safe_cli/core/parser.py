@@ -2,42 +2,85 @@
 Command parser for tokenizing and analyzing shell commands.
 """
 
+import re
 import shlex
-from dataclasses import dataclass
-from typing import List, Optional
+import sys
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import Collection, FrozenSet, List, Optional, Sequence, Tuple
 
+# Characters that need shlex's quoting/escaping rules
+_QUOTING_RE = re.compile(r"[\"'\\]")
 
-@dataclass
+# A word as shlex sees it when there is nothing quoted or escaped
+_PLAIN_WORD_RE = re.compile(r"[^ \t\r\n]+")
+
+# Pipes, redirects and command separators ('&&' but not a lone '&')
+_COMPOUND_RE = re.compile(r"[|;<>]|&&")
+
+# Boundaries between the commands of a compound command
+_SPLIT_RE = re.compile(r"&&|\|\||[|;&]")
+
+
+def _short_flag_bit(flag: str) -> int:
+    """Get the mask bit for a single short flag like '-r' (0 if not one)."""
+    if len(flag) == 2 and flag[0] == "-" and flag[1] != "-":
+        return 1 << ord(flag[1])
+    return 0
+
+
+@dataclass(frozen=True)
 class ParsedCommand:
     """Represents a parsed shell command."""
 
     raw: str
-    tokens: List[str]
+    tokens: Tuple[str, ...]
     command: str
-    args: List[str]
-    flags: List[str]
+    args: Tuple[str, ...]
+    flags: Tuple[str, ...]
+
+    # Derived from flags at construction so flag checks don't rescan them
+    flag_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    short_flag_mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Freeze token sequences and precompute flag lookup structures."""
+        for name in ("tokens", "args", "flags"):
+            object.__setattr__(self, name, tuple(getattr(self, name)))
+
+        names = set(self.flags)
+        mask = 0
+        for f in self.flags:
+            if f.startswith("--"):
+                # '--output=file' also counts as '--output'
+                names.add(f.split("=", 1)[0])
+            elif len(f) > 1 and f[0] == "-":
+                # One bit per character of combined short flags like '-rf'
+                for char in f[1:]:
+                    mask |= 1 << ord(char)
+        object.__setattr__(self, "flag_set", frozenset(names))
+        object.__setattr__(self, "short_flag_mask", mask)
+
+    @cached_property
+    def arg_set(self) -> FrozenSet[str]:
+        """Arguments as a set, built on first use for membership tests."""
+        return frozenset(self.args)
 
     def has_flag(self, flag: str) -> bool:
         """Check if command has a specific flag."""
-        # Direct match or startswith handles flags like '--output=file'
-        if flag in self.flags or any(f.startswith(flag) for f in self.flags):
+        if flag in self.flag_set:
             return True
 
         # Support combined short flags (e.g., '-rf' should match '-r' and '-f')
-        # Only apply this logic for single-dash short flags like '-f'
-        if flag.startswith("-") and not flag.startswith("--") and len(flag) == 2:
-            short = flag[1]
-            for f in self.flags:
-                if f.startswith("-") and not f.startswith("--"):
-                    # skip lone '-' and negative numbers
-                    if len(f) > 1 and short in f[1:]:
-                        return True
-
-        return False
-
-    def has_any_flag(self, flags: List[str]) -> bool:
+        return bool(self.short_flag_mask & _short_flag_bit(flag))
+
+    def has_any_flag(self, flags: Collection[str]) -> bool:
         """Check if command has any of the specified flags."""
-        return any(self.has_flag(f) for f in flags)
+        if not self.flag_set.isdisjoint(flags):
+            return True
+
+        mask = self.short_flag_mask
+        return mask != 0 and any(mask & _short_flag_bit(f) for f in flags)
 
     def get_flag_value(self, flag: str) -> Optional[str]:
         """Get value for a flag like --output=file.txt or -o file.txt."""
@@ -73,38 +116,74 @@ class CommandParser:
         Raises:
             ValueError: If command is empty or invalid
         """
+        return _parse_cached(command)
+
+    @staticmethod
+    def _parse_uncached(command: str) -> ParsedCommand:
+        """Parse a command string; see parse()."""
         if not command or not command.strip():
             raise ValueError("Command cannot be empty")
 
-        # Tokenize using shlex (handles quotes, escapes, etc.)
-        try:
-            tokens = shlex.split(command)
-        except ValueError as e:
-            raise ValueError(f"Invalid command syntax: {e}") from e
+        # Plain commands split on whitespace exactly like shlex would; only
+        # pay for shlex (quotes, escapes, etc.) when they're present
+        if _QUOTING_RE.search(command) is None:
+            tokens = _PLAIN_WORD_RE.findall(command)
+        else:
+            try:
+                tokens = shlex.split(command)
+            except ValueError as e:
+                raise ValueError(f"Invalid command syntax: {e}") from e
 
         if not tokens:
             raise ValueError("Command produced no tokens")
 
-        # First token is always the command
-        cmd = tokens[0]
-        remaining = tokens[1:]
+        return CommandParser._from_tokens(command, tokens)
+
+    def parse_tokens(self, tokens: Sequence[str]) -> ParsedCommand:
+        """
+        Build a ParsedCommand from an already tokenized command line.
+
+        Use this for argv-style input, where the shell has already done the
+        splitting and quote removal.
+
+        Args:
+            tokens: Command tokens, command name first
+
+        Returns:
+            ParsedCommand whose raw form quotes tokens as needed to round-trip
+
+        Raises:
+            ValueError: If no tokens are given
+        """
+        if not tokens:
+            raise ValueError("Command cannot be empty")
+
+        return self._from_tokens(shlex.join(tokens), tokens)
+
+    @staticmethod
+    def _from_tokens(raw: str, tokens: Sequence[str]) -> ParsedCommand:
+        """Split tokens into command, flags and args."""
+        # First token is always the command. Command names and flags come from
+        # a small vocabulary that rules compare against over and over, so they
+        # are interned; arguments (paths, messages) are not.
+        cmd = sys.intern(tokens[0])
 
         # Separate flags from arguments
-        flags = []
-        args = []
+        flags: List[str] = []
+        args: List[str] = []
 
-        for token in remaining:
+        for token in tokens[1:]:
             if token.startswith("-"):
-                flags.append(token)
+                flags.append(sys.intern(token))
             else:
                 args.append(token)
 
         return ParsedCommand(
-            raw=command,
-            tokens=tokens,
+            raw=raw,
+            tokens=tuple(tokens),
             command=cmd,
-            args=args,
-            flags=flags,
+            args=tuple(args),
+            flags=tuple(flags),
         )
 
     def is_compound_command(self, command: str) -> bool:
@@ -117,8 +196,7 @@ class CommandParser:
         Returns:
             True if command is compound
         """
-        compound_operators = ["|", "&&", "||", ";", ">", ">>", "<"]
-        return any(op in command for op in compound_operators)
+        return _COMPOUND_RE.search(command) is not None
 
     def split_compound_command(self, command: str) -> List[str]:
         """
@@ -135,8 +213,16 @@ class CommandParser:
         """
         # For MVP, just split on common operators
         # TODO: Properly handle quotes and escapes
-        import re
-
         # Split on pipes, semicolons, and logical operators
-        parts = re.split(r"[|;&]|&&|\|\|", command)
+        parts = _SPLIT_RE.split(command)
         return [p.strip() for p in parts if p.strip()]
+
+
+@lru_cache(maxsize=256)
+def _parse_cached(command: str) -> ParsedCommand:
+    """Parse a command string, reusing results for recently seen commands.
+
+    ParsedCommand is immutable, so one instance can be shared by every
+    caller that parses the same text. Errors are raised again each time.
+    """
+    return CommandParser._parse_uncached(command)
@@ -2,7 +2,8 @@
 Safe alternative suggestion generator.
 """
 
-from typing import List, Optional
+from itertools import chain
+from typing import Callable, Dict, List, Optional
 
 from safe_cli.core.parser import ParsedCommand
 from safe_cli.utils.constants import (
@@ -10,6 +11,15 @@ from safe_cli.utils.constants import (
     INTERACTIVE_FLAGS,
 )
 
+# Safer permission to suggest for each dangerous chmod mode
+_PERM_REPLACEMENTS: Dict[str, str] = {
+    "777": "755",
+    "a+rwx": "755",
+    "ugo+rwx": "755",
+    "666": "644",
+}
+_DANGEROUS_PERMS = frozenset(_PERM_REPLACEMENTS)
+
 
 class SafeAlternativeGenerator:
     """Generates safer alternatives for dangerous commands."""
@@ -24,20 +34,8 @@ class SafeAlternativeGenerator:
         Returns:
             Safer alternative command or None
         """
-        cmd = command.command
-
-        if cmd == "rm":
-            return self._safe_rm(command)
-        elif cmd == "mv":
-            return self._safe_mv(command)
-        elif cmd == "cp":
-            return self._safe_cp(command)
-        elif cmd == "chmod":
-            return self._safe_chmod(command)
-        elif cmd == "chown":
-            return self._safe_chown(command)
-
-        return None
+        handler = _GENERATORS.get(command.command)
+        return handler(self, command) if handler else None
 
     def _safe_rm(self, command: ParsedCommand) -> Optional[str]:
         """Generate safer rm alternative."""
@@ -46,11 +44,7 @@ class SafeAlternativeGenerator:
             return None
 
         # Add -i flag
-        flags = ["-i"] + command.flags
-        args = command.args
-
-        parts = [command.command] + flags + args
-        return " ".join(parts)
+        return " ".join(chain((command.command, "-i"), command.flags, command.args))
 
     def _safe_mv(self, command: ParsedCommand) -> Optional[str]:
         """Generate safer mv alternative."""
@@ -59,12 +53,8 @@ class SafeAlternativeGenerator:
             return None
 
         # Add -i flag, remove -f if present
-        flags = [f for f in command.flags if f not in FORCE_FLAGS]
-        flags = ["-i"] + flags
-        args = command.args
-
-        parts = [command.command] + flags + args
-        return " ".join(parts)
+        flags = (f for f in command.flags if f not in FORCE_FLAGS)
+        return " ".join(chain((command.command, "-i"), flags, command.args))
 
     def _safe_cp(self, command: ParsedCommand) -> Optional[str]:
         """Generate safer cp alternative."""
@@ -77,40 +67,17 @@ class SafeAlternativeGenerator:
             return None
 
         # Add -i flag, remove -f if present
-        flags = [f for f in command.flags if f not in FORCE_FLAGS]
-        flags = ["-i"] + flags
-        args = command.args
-
-        parts = [command.command] + flags + args
-        return " ".join(parts)
+        flags = (f for f in command.flags if f not in FORCE_FLAGS)
+        return " ".join(chain((command.command, "-i"), flags, command.args))
 
     def _safe_chmod(self, command: ParsedCommand) -> Optional[str]:
         """Generate safer chmod alternative."""
-        # Check for dangerous permissions
-        dangerous_perms = ["777", "666", "a+rwx", "ugo+rwx"]
-
-        # Find if any dangerous permission is in args
-        new_args = []
-        changed = False
-
-        for arg in command.args:
-            if arg in dangerous_perms:
-                # Suggest 755 instead of 777, 644 instead of 666
-                if arg in ["777", "a+rwx", "ugo+rwx"]:
-                    new_args.append("755")
-                    changed = True
-                elif arg == "666":
-                    new_args.append("644")
-                    changed = True
-                else:
-                    new_args.append(arg)
-            else:
-                new_args.append(arg)
-
-        if not changed:
+        # Nothing to rewrite unless a dangerous permission is present
+        if _DANGEROUS_PERMS.isdisjoint(command.args):
             return None
 
-        parts = [command.command] + command.flags + new_args
+        new_args = [_PERM_REPLACEMENTS.get(arg, arg) for arg in command.args]
+        parts = [command.command, *command.flags, *new_args]
         return " ".join(parts)
 
     def _safe_chown(self, command: ParsedCommand) -> Optional[str]:
@@ -139,16 +106,35 @@ class SafeAlternativeGenerator:
             alternatives.append(primary)
 
         # Additional alternatives based on command type
-        if command.command == "rm" and len(alternatives) < count:
-            # Suggest using trash instead
-            alternatives.append(
-                f"# Move to trash instead: mv {' '.join(command.args)} ~/.Trash/"
-            )
-
-        if command.command == "chmod" and len(alternatives) < count:
-            # Suggest more specific permissions
-            alternatives.append(
-                "# Use more specific permissions: 644 for files, 755 for executables"
-            )
+        extra = _EXTRA_ALTERNATIVES.get(command.command)
+        if extra and len(alternatives) < count:
+            alternatives.append(extra(command))
 
         return alternatives[:count]
+
+    @staticmethod
+    def _trash_hint(command: ParsedCommand) -> str:
+        """Suggest using trash instead of rm."""
+        return f"# Move to trash instead: mv {' '.join(command.args)} ~/.Trash/"
+
+    @staticmethod
+    def _chmod_hint(command: ParsedCommand) -> str:
+        """Suggest more specific permissions."""
+        return "# Use more specific permissions: 644 for files, 755 for executables"
+
+
+# Per-command handlers, looked up once instead of walking an if/elif chain
+_GENERATORS: Dict[
+    str, Callable[[SafeAlternativeGenerator, ParsedCommand], Optional[str]]
+] = {
+    "rm": SafeAlternativeGenerator._safe_rm,
+    "mv": SafeAlternativeGenerator._safe_mv,
+    "cp": SafeAlternativeGenerator._safe_cp,
+    "chmod": SafeAlternativeGenerator._safe_chmod,
+    "chown": SafeAlternativeGenerator._safe_chown,
+}
+
+_EXTRA_ALTERNATIVES: Dict[str, Callable[[ParsedCommand], str]] = {
+    "rm": SafeAlternativeGenerator._trash_hint,
+    "chmod": SafeAlternativeGenerator._chmod_hint,
+}
@@ -2,33 +2,38 @@
 Safety rules for command analysis.
 """
 
-from safe_cli.rules.base import CompositeRule, Rule, RuleMatch
-from safe_cli.rules.docker import (
-    DockerRmiRule,
-    DockerRmRule,
-    DockerSystemPruneRule,
-    DockerVolumePruneRule,
-)
-from safe_cli.rules.filesystem import (
-    ChmodRule,
-    ChownRule,
-    CpRule,
-    MvRule,
-    RmRule,
-)
-from safe_cli.rules.git import (
-    GitBranchDeleteRule,
-    GitCleanRule,
-    GitPushForceRule,
-    GitResetRule,
-)
-from safe_cli.rules.system import (
-    DdRule,
-    KillRule,
-    MkfsRule,
-    ShutdownRule,
-    SudoRule,
-)
+from importlib import import_module
+from typing import Any
+
+# Exports are resolved on first access, so importing one rule module (or just
+# the base classes) doesn't load every other rule module
+_EXPORTS = {
+    "Rule": "safe_cli.rules.base",
+    "RuleMatch": "safe_cli.rules.base",
+    "CompositeRule": "safe_cli.rules.base",
+    # Filesystem
+    "RmRule": "safe_cli.rules.filesystem",
+    "MvRule": "safe_cli.rules.filesystem",
+    "CpRule": "safe_cli.rules.filesystem",
+    "ChmodRule": "safe_cli.rules.filesystem",
+    "ChownRule": "safe_cli.rules.filesystem",
+    # Git
+    "GitResetRule": "safe_cli.rules.git",
+    "GitPushForceRule": "safe_cli.rules.git",
+    "GitCleanRule": "safe_cli.rules.git",
+    "GitBranchDeleteRule": "safe_cli.rules.git",
+    # Docker
+    "DockerSystemPruneRule": "safe_cli.rules.docker",
+    "DockerRmRule": "safe_cli.rules.docker",
+    "DockerRmiRule": "safe_cli.rules.docker",
+    "DockerVolumePruneRule": "safe_cli.rules.docker",
+    # System
+    "SudoRule": "safe_cli.rules.system",
+    "DdRule": "safe_cli.rules.system",
+    "KillRule": "safe_cli.rules.system",
+    "ShutdownRule": "safe_cli.rules.system",
+    "MkfsRule": "safe_cli.rules.system",
+}
 
 __all__ = [
     "Rule",
@@ -57,3 +62,11 @@ __all__ = [
     "ShutdownRule",
     "MkfsRule",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import rule exports on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
@@ -4,13 +4,14 @@ Base classes for safety rules.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from safe_cli.core.parser import ParsedCommand
 from safe_cli.utils.constants import DangerLevel
 
 
-@dataclass
+@dataclass(frozen=True)
 class RuleMatch:
     """Represents a rule match with details."""
 
@@ -28,6 +29,39 @@ class RuleMatch:
             raise ValueError("message cannot be empty")
 
 
+@lru_cache(maxsize=None)
+def shared_match(
+    rule_name: str,
+    level: DangerLevel,
+    message: str,
+    suggestion: Optional[str] = None,
+    safe_alternative: Optional[str] = None,
+) -> RuleMatch:
+    """
+    Get a RuleMatch shared by every command with the same outcome.
+
+    Rules use this for outcomes that don't depend on the command text, so
+    the common low-danger results aren't rebuilt on every analysis.
+
+    Args:
+        rule_name: Name of the rule producing the match
+        level: Danger level of the outcome
+        message: Warning message
+        suggestion: Optional suggestion
+        safe_alternative: Optional safer command
+
+    Returns:
+        Cached RuleMatch for these values
+    """
+    return RuleMatch(
+        rule_name=rule_name,
+        danger_level=level,
+        message=message,
+        suggestion=suggestion,
+        safe_alternative=safe_alternative,
+    )
+
+
 class Rule(ABC):
     """Base class for all safety rules."""
 
@@ -35,6 +69,15 @@ class Rule(ABC):
     name: str = "base_rule"
     description: str = "Base rule"
 
+    # Command names this rule can match, used by the registry to skip rules
+    # that can't apply. Rules that declare neither are checked for every command.
+    triggers: Tuple[str, ...] = ()
+    trigger_prefixes: Tuple[str, ...] = ()
+
+    # Arguments (e.g. subcommands) that must all be present for the rule to
+    # apply; checked against the command's arguments before matches() is called
+    trigger_args: Tuple[str, ...] = ()
+
     @abstractmethod
     def matches(self, command: ParsedCommand) -> bool:
         """
@@ -61,6 +104,19 @@ class Rule(ABC):
         """
         pass
 
+    def analyze_if_matches(self, command: ParsedCommand) -> Optional[RuleMatch]:
+        """
+        Analyze the command if this rule matches it.
+        Override this when matching and analysis share work.
+
+        Args:
+            command: Parsed command to analyze
+
+        Returns:
+            RuleMatch if the rule matches, None otherwise
+        """
+        return self.analyze(command) if self.matches(command) else None
+
     def get_danger_level(self, command: ParsedCommand) -> DangerLevel:
         """
         Calculate danger level for the command.
@@ -141,17 +197,25 @@ class CompositeRule(Rule):
 
     def analyze(self, command: ParsedCommand) -> RuleMatch:
         """Analyze using all matching sub-rules."""
-        matches = [
-            rule.analyze(command) for rule in self.rules if rule.matches(command)
-        ]
-
-        if not matches:
+        match = self.analyze_if_matches(command)
+        if match is None:
             return RuleMatch(
                 rule_name=self.name,
                 danger_level=DangerLevel.SAFE,
                 message="No risks detected",
             )
-
-        # Return the highest danger level match
-        highest = max(matches, key=lambda m: m.danger_level)
-        return highest
+        return match
+
+    def analyze_if_matches(self, command: ParsedCommand) -> Optional[RuleMatch]:
+        """Get the highest danger match among sub-rules, if any match."""
+        best: Optional[RuleMatch] = None
+        for rule in self.rules:
+            match = rule.analyze_if_matches(command)
+            if match is None:
+                continue
+            if best is None or match.danger_level > best.danger_level:
+                best = match
+                # Nothing can outrank CRITICAL, so skip the remaining rules
+                if best.danger_level is DangerLevel.CRITICAL:
+                    break
+        return best
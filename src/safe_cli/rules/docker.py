@@ -2,106 +2,175 @@
 Docker operation safety rules.
 """
 
+import re
+from typing import Dict, Optional, Sequence, Tuple, Union
+
 from safe_cli.core.parser import ParsedCommand
-from safe_cli.rules.base import Rule, RuleMatch
+from safe_cli.rules.base import Rule, RuleMatch, shared_match
 from safe_cli.utils.constants import DangerLevel
 
+# Whole flag tokens (with their leading space) to drop from a command line
+# when building a safer alternative
+_FORCE_FLAG_RE = re.compile(r"\s+(?:-f|--force)(?=\s|$)")
+_VOLUMES_FLAG_RE = re.compile(r"\s+(?:-v|--volumes)(?=\s|$)")
+_ALL_FLAG_RE = re.compile(r"\s+(?:-a|--all)(?=\s|$)")
+
+# Docker's spellings of common flags; has_any_flag also finds combined short
+# flags like '-fv'
+_FORCE_FLAGS = ("-f", "--force")
+_VOLUMES_FLAGS = ("-v", "--volumes")
+_ALL_FLAGS = ("-a", "--all")
+
+
+def _operands(args: Sequence[str], subcommand: str) -> Sequence[str]:
+    """Get the arguments that follow a docker subcommand."""
+    # The subcommand is almost always the first argument, so a slice is enough
+    if args and args[0] == subcommand:
+        return args[1:]
+    return [arg for arg in args if arg != subcommand]
+
+
+# Outcome of a docker system prune: danger level, message, suggestion, and
+# the safe alternative as a fixed command or a pattern of flags to strip
+_PruneOutcome = Tuple[DangerLevel, str, str, Union[str, re.Pattern[str], None]]
+
+# Base outcome by what will be deleted, keyed by (has_all, has_volumes)
+_SYSTEM_PRUNE_BASE: Dict[Tuple[bool, bool], _PruneOutcome] = {
+    (True, True): (
+        DangerLevel.CRITICAL,
+        "This will remove ALL unused containers, networks, images (both dangling and unused), "
+        "AND volumes. This includes data volumes which could contain important data!",
+        "Run without --volumes first, then manually clean volumes if needed.",
+        _VOLUMES_FLAG_RE,
+    ),
+    (True, False): (
+        DangerLevel.HIGH,
+        "This will remove ALL unused containers, networks, and images "
+        "(including non-dangling images). You may lose important images!",
+        "Run without --all to only remove dangling images.",
+        _ALL_FLAG_RE,
+    ),
+    (False, True): (
+        DangerLevel.HIGH,
+        "This will remove unused volumes which may contain important data. "
+        "Volume data cannot be recovered!",
+        "List volumes first with 'docker volume ls' and remove specific ones.",
+        "docker volume ls",
+    ),
+    (False, False): (
+        DangerLevel.MEDIUM,
+        "This will remove unused containers, networks, and dangling images. "
+        "Active resources won't be affected.",
+        "Review what will be removed with 'docker system df' first.",
+        None,
+    ),
+}
+
+
+def _with_force(outcome: _PruneOutcome) -> _PruneOutcome:
+    """Escalate a prune outcome for --force, which skips the confirmation."""
+    danger_level, message, _, _ = outcome
+    return (
+        DangerLevel.CRITICAL if danger_level >= DangerLevel.HIGH else DangerLevel.HIGH,
+        message
+        + " The --force flag skips the confirmation prompt, making accidental data loss more likely.",
+        "Remove --force to review what will be deleted before proceeding.",
+        _FORCE_FLAG_RE,
+    )
+
+
+# Every outcome, indexed by has_all << 2 | has_volumes << 1 | has_force
+_SYSTEM_PRUNE_OUTCOMES: Tuple[_PruneOutcome, ...] = tuple(
+    _with_force(base) if has_force else base
+    for base in (
+        _SYSTEM_PRUNE_BASE[(has_all, has_volumes)]
+        for has_all in (False, True)
+        for has_volumes in (False, True)
+    )
+    for has_force in (False, True)
+)
+
+
+# Outcome of a forced or volume-removing docker rm: danger level, message,
+# suggestion, and the flags to strip for the safe alternative (None to stop
+# the containers instead)
+_RmOutcome = Tuple[DangerLevel, str, str, Optional[re.Pattern[str]]]
+
+_DOCKER_RM_VOLUMES: _RmOutcome = (
+    DangerLevel.HIGH,
+    "This will remove the container and its associated volumes. "
+    "Data in volumes will be permanently lost!",
+    "Remove the -v/--volumes flag to preserve volume data.",
+    _VOLUMES_FLAG_RE,
+)
+
+# Keyed by (has_force, has_volumes, is_multiple); plain removals are handled
+# before the lookup
+_DOCKER_RM_OUTCOMES: Dict[Tuple[bool, bool, bool], _RmOutcome] = {
+    (True, True, True): (
+        DangerLevel.CRITICAL,
+        "This will force remove multiple containers AND their associated volumes. "
+        "Data in volumes will be permanently lost!",
+        "Remove force and volumes flags, stop containers first with 'docker stop'.",
+        None,
+    ),
+    (True, False, True): (
+        DangerLevel.HIGH,
+        "Force removing multiple containers will stop and remove them immediately. "
+        "Running containers will be killed!",
+        "Stop containers gracefully first with 'docker stop'.",
+        None,
+    ),
+    (True, True, False): _DOCKER_RM_VOLUMES,
+    (False, True, True): _DOCKER_RM_VOLUMES,
+    (False, True, False): _DOCKER_RM_VOLUMES,
+    (True, False, False): (
+        DangerLevel.MEDIUM,
+        "Force removing will stop and remove the container immediately.",
+        "Stop the container first with 'docker stop' for graceful shutdown.",
+        None,
+    ),
+}
+
 
 class DockerSystemPruneRule(Rule):
     """Safety rule for docker system prune."""
 
     name = "docker_system_prune"
     description = "Detects dangerous docker system prune operations"
+    triggers = ("docker",)
+    trigger_args = ("system", "prune")
 
     def matches(self, command: ParsedCommand) -> bool:
         """Check if command is docker system prune."""
         return (
             command.command == "docker"
-            and "system" in command.args
-            and "prune" in command.args
+            and "system" in command.arg_set
+            and "prune" in command.arg_set
         )
 
     def analyze(self, command: ParsedCommand) -> RuleMatch:
         """Analyze docker system prune for dangers."""
+        index = (
+            command.has_any_flag(_ALL_FLAGS) << 2
+            | command.has_flag("--volumes") << 1
+            | command.has_any_flag(_FORCE_FLAGS)
+        )
+        danger_level, message, suggestion, alternative = _SYSTEM_PRUNE_OUTCOMES[index]
 
-        has_all = command.has_any_flag(["-a", "--all"])
-        has_volumes = "--volumes" in command.flags
-        has_force = command.has_any_flag(["-f", "--force"])
-
-        # Base danger from what will be deleted
-        if has_all and has_volumes:
-            base_level = DangerLevel.CRITICAL
-            base_message = (
-                "This will remove ALL unused containers, networks, images (both dangling and unused), "
-                "AND volumes. This includes data volumes which could contain important data!"
-            )
-            base_suggestion = (
-                "Run without --volumes first, then manually clean volumes if needed."
-            )
-            base_safe = command.raw.replace("--volumes", "").replace("--force", "")
-
-        elif has_all:
-            base_level = DangerLevel.HIGH
-            base_message = (
-                "This will remove ALL unused containers, networks, and images "
-                "(including non-dangling images). You may lose important images!"
-            )
-            base_suggestion = "Run without --all to only remove dangling images."
-            base_safe = command.raw.replace("--all", "").replace("--force", "")
-
-        elif has_volumes:
-            base_level = DangerLevel.HIGH
-            base_message = (
-                "This will remove unused volumes which may contain important data. "
-                "Volume data cannot be recovered!"
-            )
-            base_suggestion = (
-                "List volumes first with 'docker volume ls' and remove specific ones."
-            )
-            base_safe = "docker volume ls"
-
-        else:
-            base_level = DangerLevel.MEDIUM
-            base_message = (
-                "This will remove unused containers, networks, and dangling images. "
-                "Active resources won't be affected."
-            )
-            base_suggestion = (
-                "Review what will be removed with 'docker system df' first."
-            )
-            base_safe = None
-
-        # Force flag makes everything more dangerous (no confirmation)
-        if has_force:
-            danger_level = (
-                DangerLevel.CRITICAL
-                if base_level == DangerLevel.HIGH
-                else DangerLevel.HIGH
-            )
-
-            message = (
-                base_message
-                + " The --force flag skips the confirmation prompt, making accidental data loss more likely."
-            )
-
-            suggestion = (
-                "Remove --force to review what will be deleted before proceeding."
+        # Patterns name the flags to drop from the original command; every
+        # other outcome is the same for all commands and is shared
+        if not isinstance(alternative, re.Pattern):
+            return shared_match(
+                self.name, danger_level, message, suggestion, alternative
             )
 
-            safe_alternative = command.raw.replace("--force", "")
-
-        else:
-            danger_level = base_level
-            message = base_message
-            suggestion = base_suggestion
-            safe_alternative = base_safe  # type: ignore
-
         return RuleMatch(
             rule_name=self.name,
             danger_level=danger_level,
             message=message,
             suggestion=suggestion,
-            safe_alternative=safe_alternative,
+            safe_alternative=alternative.sub("", command.raw),
         )
 
 
@@ -110,71 +179,40 @@ class DockerRmRule(Rule):
 
     name = "docker_rm"
     description = "Detects dangerous docker rm operations"
+    triggers = ("docker",)
+    trigger_args = ("rm",)
 
     def matches(self, command: ParsedCommand) -> bool:
         """Check if command is docker rm."""
-        return command.command == "docker" and "rm" in command.args
+        return command.command == "docker" and "rm" in command.arg_set
 
     def analyze(self, command: ParsedCommand) -> RuleMatch:
         """Analyze docker rm for dangers."""
         # Check for force and volume flags (including combined like -fv)
-        has_force = command.has_any_flag(["-f", "--force"])
-        has_volumes = command.has_any_flag(["-v", "--volumes"])
+        has_force = command.has_any_flag(_FORCE_FLAGS)
+        has_volumes = command.has_any_flag(_VOLUMES_FLAGS)
 
-        # Also check combined flags like -fv
-        for flag in command.flags:
-            if flag.startswith("-") and not flag.startswith("--"):
-                if "f" in flag:
-                    has_force = True
-                if "v" in flag:
-                    has_volumes = True
+        # Plain removal of stopped containers; nothing else to work out
+        if not has_force and not has_volumes:
+            return shared_match(
+                self.name, DangerLevel.LOW, "This will remove stopped container(s)."
+            )
 
         # Check if removing multiple containers or using wildcards
-        container_args = [arg for arg in command.args if arg != "rm"]
+        container_args = _operands(command.args, "rm")
         is_multiple = len(container_args) > 1 or any(
             "*" in arg for arg in container_args
         )
 
-        if has_force and has_volumes and is_multiple:
-            danger_level = DangerLevel.CRITICAL
-            message = (
-                "This will force remove multiple containers AND their associated volumes. "
-                "Data in volumes will be permanently lost!"
-            )
-            suggestion = "Remove force and volumes flags, stop containers first with 'docker stop'."
-            safe_alternative = f"docker stop {' '.join(container_args)}"
+        danger_level, message, suggestion, strip_flags = _DOCKER_RM_OUTCOMES[
+            (has_force, has_volumes, is_multiple)
+        ]
 
-        elif has_force and is_multiple:
-            danger_level = DangerLevel.HIGH
-            message = (
-                "Force removing multiple containers will stop and remove them immediately. "
-                "Running containers will be killed!"
-            )
-            suggestion = "Stop containers gracefully first with 'docker stop'."
-            safe_alternative = f"docker stop {' '.join(container_args)}"
-
-        elif has_volumes:
-            danger_level = DangerLevel.HIGH
-            message = (
-                "This will remove the container and its associated volumes. "
-                "Data in volumes will be permanently lost!"
-            )
-            suggestion = "Remove the -v/--volumes flag to preserve volume data."
-            safe_alternative = command.raw.replace("-v", "").replace("--volumes", "")
-
-        elif has_force:
-            danger_level = DangerLevel.MEDIUM
-            message = "Force removing will stop and remove the container immediately."
-            suggestion = (
-                "Stop the container first with 'docker stop' for graceful shutdown."
-            )
+        # Without flags to strip, suggest stopping the same containers instead
+        if strip_flags is None:
             safe_alternative = f"docker stop {' '.join(container_args)}"
-
         else:
-            danger_level = DangerLevel.LOW
-            message = "This will remove stopped container(s)."
-            suggestion = None
-            safe_alternative = None
+            safe_alternative = strip_flags.sub("", command.raw)
 
         return RuleMatch(
             rule_name=self.name,
@@ -190,17 +228,19 @@ class DockerRmiRule(Rule):
 
     name = "docker_rmi"
     description = "Detects dangerous docker rmi operations"
+    triggers = ("docker",)
+    trigger_args = ("rmi",)
 
     def matches(self, command: ParsedCommand) -> bool:
         """Check if command is docker rmi."""
-        return command.command == "docker" and "rmi" in command.args
+        return command.command == "docker" and "rmi" in command.arg_set
 
     def analyze(self, command: ParsedCommand) -> RuleMatch:
         """Analyze docker rmi for dangers."""
-        has_force = "-f" in command.flags or "--force" in command.flags
+        has_force = command.has_any_flag(_FORCE_FLAGS)
 
         # Check if removing multiple images
-        image_args = [arg for arg in command.args if arg != "rmi"]
+        image_args = _operands(command.args, "rmi")
         is_multiple = len(image_args) > 1 or any("*" in arg for arg in image_args)
 
         if has_force and is_multiple:
@@ -210,7 +250,7 @@ class DockerRmiRule(Rule):
                 "This could break running applications!"
             )
             suggestion = "Remove the -f/--force flag and handle used images manually."
-            safe_alternative = command.raw.replace("-f", "").replace("--force", "")
+            safe_alternative = _FORCE_FLAG_RE.sub("", command.raw)
 
         elif has_force:
             danger_level = DangerLevel.MEDIUM
@@ -219,7 +259,7 @@ class DockerRmiRule(Rule):
                 "This could break running containers!"
             )
             suggestion = "Remove the -f flag to see if image is in use."
-            safe_alternative = command.raw.replace("-f", "").replace("--force", "")
+            safe_alternative = _FORCE_FLAG_RE.sub("", command.raw)
 
         elif is_multiple:
             danger_level = DangerLevel.MEDIUM
@@ -230,10 +270,9 @@ class DockerRmiRule(Rule):
             safe_alternative = None
 
         else:
-            danger_level = DangerLevel.LOW
-            message = "This will remove a Docker image."
-            suggestion = None
-            safe_alternative = None
+            return shared_match(
+                self.name, DangerLevel.LOW, "This will remove a Docker image."
+            )
 
         return RuleMatch(
             rule_name=self.name,
@@ -249,19 +288,21 @@ class DockerVolumePruneRule(Rule):
 
     name = "docker_volume_prune"
     description = "Detects dangerous docker volume prune operations"
+    triggers = ("docker",)
+    trigger_args = ("volume", "prune")
 
     def matches(self, command: ParsedCommand) -> bool:
         """Check if command is docker volume prune."""
         return (
             command.command == "docker"
-            and "volume" in command.args
-            and "prune" in command.args
+            and "volume" in command.arg_set
+            and "prune" in command.arg_set
         )
 
     def analyze(self, command: ParsedCommand) -> RuleMatch:
         """Analyze docker volume prune for dangers."""
 
-        has_force = "-f" in command.flags or "--force" in command.flags
+        has_force = command.has_any_flag(_FORCE_FLAGS)
 
         # What the command does is always dangerous
         base_message = (
@@ -276,26 +317,18 @@ class DockerVolumePruneRule(Rule):
 
         base_safe = "docker volume ls"
 
-        # Without --force, user is at least protected by confirmation
-        if has_force:
-            danger_level = DangerLevel.CRITICAL
-            message = (
-                base_message
-                + " The --force flag skips the confirmation prompt, increasing the risk of accidental data loss."
+        # Without --force, user is at least protected by confirmation, and
+        # the outcome is the same for every command
+        if not has_force:
+            return shared_match(
+                self.name, DangerLevel.HIGH, base_message, base_suggestion, base_safe
             )
-            suggestion = "Remove --force so you can review what will be deleted first."
-            safe_alternative = command.raw.replace("-f", "").replace("--force", "")
-
-        else:
-            danger_level = DangerLevel.HIGH
-            message = base_message
-            suggestion = base_suggestion
-            safe_alternative = base_safe
 
         return RuleMatch(
             rule_name=self.name,
-            danger_level=danger_level,
-            message=message,
-            suggestion=suggestion,
-            safe_alternative=safe_alternative,
+            danger_level=DangerLevel.CRITICAL,
+            message=base_message
+            + " The --force flag skips the confirmation prompt, increasing the risk of accidental data loss.",
+            suggestion="Remove --force so you can review what will be deleted first.",
+            safe_alternative=_FORCE_FLAG_RE.sub("", command.raw),
         )
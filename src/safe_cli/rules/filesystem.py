@@ -2,10 +2,10 @@
 Filesystem safety rules (rm, mv, cp, chmod, chown).
 """
 
-from typing import Optional
+from itertools import chain
 
 from safe_cli.core.parser import ParsedCommand
-from safe_cli.rules.base import Rule, RuleMatch
+from safe_cli.rules.base import Rule, RuleMatch, shared_match
 from safe_cli.utils.constants import (
     DANGEROUS_PATHS,
     FORCE_FLAGS,
@@ -14,6 +14,17 @@ from safe_cli.utils.constants import (
     DangerLevel,
 )
 
+# Exact matches and sub-path prefixes, derived once from DANGEROUS_PATHS.
+# '/' only contributes itself and '/*' so that ordinary absolute paths like
+# '/tmp' are not considered system-critical.
+_DANGEROUS_EXACT = DANGEROUS_PATHS
+_DANGEROUS_PREFIXES = tuple(
+    "/*" if path == "/" else path + "/" for path in DANGEROUS_PATHS
+)
+
+# Permission modes that make files world-writable
+_DANGEROUS_PERMS = frozenset(("777", "666", "a+rwx", "ugo+rwx"))
+
 
 def _path_is_dangerous(path: str) -> bool:
     """Determine if a target path matches one of the dangerous paths.
@@ -22,16 +33,7 @@ def _path_is_dangerous(path: str) -> bool:
     is a sub-path (i.e. startswith(dangerous + '/')). Special-case '/' so
     that ordinary absolute paths like '/tmp' are not considered system-critical.
     """
-    for dangerous in DANGEROUS_PATHS:
-        if dangerous == "/":
-            if path == "/" or path.startswith("/*"):
-                return True
-            continue
-
-        if path == dangerous or path.startswith(dangerous + "/"):
-            return True
-
-    return False
+    return path in _DANGEROUS_EXACT or path.startswith(_DANGEROUS_PREFIXES)
 
 
 class RmRule(Rule):
@@ -39,6 +41,7 @@ class RmRule(Rule):
 
     name = "rm_command"
     description = "Detects dangerous rm operations"
+    triggers = ("rm",)
 
     def matches(self, command: ParsedCommand) -> bool:
         """Check if command is rm."""
@@ -46,92 +49,60 @@ class RmRule(Rule):
 
     def analyze(self, command: ParsedCommand) -> RuleMatch:
         """Analyze rm command for dangers."""
-        danger_level = self._calculate_danger(command)
-        message = self._get_message(command)
-        suggestion = self._get_suggestion(command)
-        safe_alt = self._get_safe_alternative(command)
-
-        return RuleMatch(
-            rule_name=self.name,
-            danger_level=danger_level,
-            message=message,
-            suggestion=suggestion,
-            safe_alternative=safe_alt,
-        )
-
-    def _calculate_danger(self, command: ParsedCommand) -> DangerLevel:
-        """Calculate danger level for rm command."""
+        # Each predicate is computed once and shared by every decision below
         has_recursive = command.has_any_flag(RECURSIVE_FLAGS)
         has_force = command.has_any_flag(FORCE_FLAGS)
         has_interactive = command.has_any_flag(INTERACTIVE_FLAGS)
 
-        # Check paths
         targets = command.args
         has_dangerous_path = any(_path_is_dangerous(path) for path in targets)
         has_wildcard = any("*" in path for path in targets)
 
-        # Critical: recursive + force on dangerous paths
-        if has_recursive and has_force and has_dangerous_path:
-            return DangerLevel.CRITICAL
-
-        # Critical: recursive + force + wildcard
-        if has_recursive and has_force and has_wildcard:
-            return DangerLevel.CRITICAL
-
+        # Critical: recursive + force on dangerous paths or wildcards
+        if has_recursive and has_force and (has_dangerous_path or has_wildcard):
+            danger_level = DangerLevel.CRITICAL
         # High: recursive + force
-        if has_recursive and has_force:
-            return DangerLevel.HIGH
-
+        elif has_recursive and has_force:
+            danger_level = DangerLevel.HIGH
         # High: dangerous paths without interactive
-        if has_dangerous_path and not has_interactive:
-            return DangerLevel.HIGH
-
+        elif has_dangerous_path and not has_interactive:
+            danger_level = DangerLevel.HIGH
         # Medium: recursive or force alone
-        if has_recursive or has_force:
-            return DangerLevel.MEDIUM
-
+        elif has_recursive or has_force:
+            danger_level = DangerLevel.MEDIUM
         # Low: normal rm
-        return DangerLevel.LOW
-
-    def _get_message(self, command: ParsedCommand) -> str:
-        """Get warning message."""
-        has_recursive = command.has_any_flag(RECURSIVE_FLAGS)
-        has_force = command.has_any_flag(FORCE_FLAGS)
-        targets = command.args
+        else:
+            danger_level = DangerLevel.LOW
 
         if has_recursive and has_force:
-            return (
+            message = (
                 "This will permanently delete files recursively without prompting. "
                 "This operation cannot be undone!"
             )
         elif has_recursive:
-            return "This will delete directories and all their contents recursively."
+            message = "This will delete directories and all their contents recursively."
         elif has_force:
-            return "This will force delete files without prompting for confirmation."
-        elif any(_path_is_dangerous(t) for t in targets):
-            return "This targets system-critical directories. Deletion could break your system!"
+            message = "This will force delete files without prompting for confirmation."
+        elif has_dangerous_path:
+            message = "This targets system-critical directories. Deletion could break your system!"
         else:
-            return "This will permanently delete files."
-
-    def _get_suggestion(self, command: ParsedCommand) -> Optional[str]:
-        """Get safety suggestion."""
-        has_interactive = command.has_any_flag(INTERACTIVE_FLAGS)
-
-        if not has_interactive:
-            return "Consider using -i or --interactive flag to confirm each deletion."
-        return None
-
-    def _get_safe_alternative(self, command: ParsedCommand) -> Optional[str]:
-        """Generate safer alternative command."""
-        has_interactive = command.has_any_flag(INTERACTIVE_FLAGS)
+            message = "This will permanently delete files."
 
+        suggestion = None
+        safe_alt = None
         if not has_interactive:
-            # Add -i flag
-            flags = " ".join(command.flags)
-            args = " ".join(command.args)
-            return f"rm -i {flags} {args}".strip()
+            suggestion = (
+                "Consider using -i or --interactive flag to confirm each deletion."
+            )
+            safe_alt = " ".join(chain(("rm", "-i"), command.flags, targets))
 
-        return None
+        return RuleMatch(
+            rule_name=self.name,
+            danger_level=danger_level,
+            message=message,
+            suggestion=suggestion,
+            safe_alternative=safe_alt,
+        )
 
 
 class MvRule(Rule):
@@ -139,6 +110,7 @@ class MvRule(Rule):
 
     name = "mv_command"
     description = "Detects dangerous mv operations"
+    triggers = ("mv",)
 
     def matches(self, command: ParsedCommand) -> bool:
         """Check if command is mv."""
@@ -165,17 +137,16 @@ class MvRule(Rule):
             danger_level = DangerLevel.MEDIUM
             message = "Moving system-critical files could cause issues."
         else:
-            danger_level = DangerLevel.LOW
-            message = "This will move or rename files."
+            return shared_match(
+                self.name, DangerLevel.LOW, "This will move or rename files."
+            )
 
         suggestion = None
         safe_alt = None
 
-        if not has_interactive and (has_force or has_dangerous_path):
+        if not has_interactive:
             suggestion = "Consider using -i flag to confirm overwrites."
-            flags = " ".join(command.flags)
-            args = " ".join(command.args)
-            safe_alt = f"mv -i {flags} {args}".strip()
+            safe_alt = " ".join(chain(("mv", "-i"), command.flags, targets))
 
         return RuleMatch(
             rule_name=self.name,
@@ -191,6 +162,7 @@ class CpRule(Rule):
 
     name = "cp_command"
     description = "Detects dangerous cp operations"
+    triggers = ("cp",)
 
     def matches(self, command: ParsedCommand) -> bool:
         """Check if command is cp."""
@@ -212,13 +184,13 @@ class CpRule(Rule):
             message = "This will overwrite existing files without prompting."
             suggestion = "Consider using -i flag to confirm overwrites."
         elif has_recursive:
-            danger_level = DangerLevel.LOW
-            message = "This will recursively copy directories."
-            suggestion = None
+            return shared_match(
+                self.name, DangerLevel.LOW, "This will recursively copy directories."
+            )
         else:
-            danger_level = DangerLevel.SAFE
-            message = "Standard file copy operation."
-            suggestion = None
+            return shared_match(
+                self.name, DangerLevel.SAFE, "Standard file copy operation."
+            )
 
         return RuleMatch(
             rule_name=self.name,
@@ -233,6 +205,7 @@ class ChmodRule(Rule):
 
     name = "chmod_command"
     description = "Detects dangerous chmod operations"
+    triggers = ("chmod",)
 
     def matches(self, command: ParsedCommand) -> bool:
         """Check if command is chmod."""
@@ -244,16 +217,14 @@ class ChmodRule(Rule):
         args = command.args
 
         # Check for dangerous permissions
-        dangerous_perms = ["777", "666", "a+rwx", "ugo+rwx"]
-        has_dangerous_perm = any(perm in args for perm in dangerous_perms)
+        has_dangerous_perm = not command.arg_set.isdisjoint(_DANGEROUS_PERMS)
 
         # Check for system paths
-        targets = [
-            arg
+        has_dangerous_path = any(
+            _path_is_dangerous(arg)
             for arg in args
-            if not arg.startswith("-") and arg not in dangerous_perms
-        ]
-        has_dangerous_path = any(_path_is_dangerous(path) for path in targets)
+            if arg[:1] != "-" and arg not in _DANGEROUS_PERMS
+        )
 
         if has_dangerous_perm and has_recursive and has_dangerous_path:
             danger_level = DangerLevel.CRITICAL
@@ -268,8 +239,9 @@ class ChmodRule(Rule):
             danger_level = DangerLevel.HIGH
             message = "Recursively changing permissions on system paths could break your system."
         else:
-            danger_level = DangerLevel.LOW
-            message = "This will change file permissions."
+            return shared_match(
+                self.name, DangerLevel.LOW, "This will change file permissions."
+            )
 
         suggestion = None
         if has_dangerous_perm:
@@ -288,6 +260,7 @@ class ChownRule(Rule):
 
     name = "chown_command"
     description = "Detects dangerous chown operations"
+    triggers = ("chown",)
 
     def matches(self, command: ParsedCommand) -> bool:
         """Check if command is chown."""
@@ -312,8 +285,9 @@ class ChownRule(Rule):
             danger_level = DangerLevel.MEDIUM
             message = "Recursively changing ownership affects all files in the directory tree."
         else:
-            danger_level = DangerLevel.LOW
-            message = "This will change file ownership."
+            return shared_match(
+                self.name, DangerLevel.LOW, "This will change file ownership."
+            )
 
         return RuleMatch(
             rule_name=self.name,
@@ -2,29 +2,82 @@
 Git operation safety rules.
 """
 
+import re
+from typing import Dict, Tuple
+
 from safe_cli.core.parser import ParsedCommand
-from safe_cli.rules.base import Rule, RuleMatch
+from safe_cli.rules.base import Rule, RuleMatch, shared_match
 from safe_cli.utils.constants import DangerLevel
 
+# Flags that make git push overwrite the remote branch
+_PUSH_FORCE_FLAGS = ("--force", "-f", "--force-with-lease")
+
+# Branches whose history is shared by everyone
+_MAIN_BRANCHES = frozenset({"main", "master", "origin/main", "origin/master"})
+
+# git clean flags that delete files, and that include ignored files
+_CLEAN_FORCE_FLAGS = ("-f", "--force")
+_CLEAN_IGNORED_FLAGS = ("-x", "-X")
+
+# Outcome of a forced git clean: danger level, message, suggestion, and the
+# dry-run command to try first
+_CleanOutcome = Tuple[DangerLevel, str, str, str]
+
+_CLEAN_FILES: _CleanOutcome = (
+    DangerLevel.MEDIUM,
+    "This will permanently delete untracked files.",
+    "Run 'git clean -fn' first to see what would be deleted.",
+    "git clean -fn",
+)
+
+# Keyed by (has_d, has_x)
+_FORCED_CLEAN_OUTCOMES: Dict[Tuple[bool, bool], _CleanOutcome] = {
+    (True, True): (
+        DangerLevel.CRITICAL,
+        "This will permanently delete ALL untracked files and directories, "
+        "including ignored files. This cannot be undone!",
+        "Run 'git clean -fdxn' first to see what would be deleted.",
+        "git clean -fdxn",
+    ),
+    (True, False): (
+        DangerLevel.HIGH,
+        "This will permanently delete all untracked files and directories. "
+        "This cannot be undone!",
+        "Run 'git clean -fdn' first to preview what will be deleted.",
+        "git clean -fdn",
+    ),
+    (False, True): _CLEAN_FILES,
+    (False, False): _CLEAN_FILES,
+}
+
+# Whole tokens to rewrite in a command line when building a safer alternative
+_HARD_FLAG_RE = re.compile(r"(?<=\s)--hard(?=\s|$)")
+_RESET_RE = re.compile(r"(?<=\s)reset(?=\s|$)")
+_PUSH_FORCE_FLAG_RE = re.compile(r"(?<=\s)(?:-f|--force)(?=\s|$)")
+_BRANCH_FORCE_DELETE_RE = re.compile(r"(?<=\s)-D(?=\s|$)")
+
 
 class GitResetRule(Rule):
     """Safety rule for git reset command."""
 
     name = "git_reset"
     description = "Detects dangerous git reset operations"
+    triggers = ("git",)
+    trigger_args = ("reset",)
 
     def matches(self, command: ParsedCommand) -> bool:
         """Check if command is git reset."""
-        return command.command == "git" and "reset" in command.args
+        return command.command == "git" and "reset" in command.arg_set
 
     def analyze(self, command: ParsedCommand) -> RuleMatch:
         """Analyze git reset command for dangers."""
-        has_hard = "--hard" in command.flags
-        has_soft = "--soft" in command.flags
-        has_mixed = "--mixed" in command.flags or (not has_hard and not has_soft)
+        has_hard = "--hard" in command.flag_set
+        has_soft = "--soft" in command.flag_set
+        has_mixed = "--mixed" in command.flag_set or (not has_hard and not has_soft)
 
         # Check how far back we're resetting
-        has_head_ref = any("HEAD~" in arg or "HEAD^" in arg for arg in command.args)
+        raw = command.raw
+        has_head_ref = "HEAD~" in raw or "HEAD^" in raw
 
         if has_hard:
             if has_head_ref:
@@ -41,7 +94,7 @@ class GitResetRule(Rule):
                 )
 
             suggestion = "Use 'git stash' to save your changes first, or 'git reset --soft' to keep changes."
-            safe_alternative = command.raw.replace("--hard", "--soft")
+            safe_alternative = _HARD_FLAG_RE.sub("--soft", command.raw)
 
         elif has_mixed:
             danger_level = DangerLevel.MEDIUM
@@ -49,7 +102,7 @@ class GitResetRule(Rule):
                 "This will unstage changes but keep them in your working directory."
             )
             suggestion = "Use 'git reset --soft' if you want to keep changes staged."
-            safe_alternative = command.raw.replace("reset", "reset --soft")
+            safe_alternative = _RESET_RE.sub("reset --soft", command.raw, count=1)
 
         else:  # --soft
             danger_level = DangerLevel.LOW
@@ -71,28 +124,23 @@ class GitPushForceRule(Rule):
 
     name = "git_push_force"
     description = "Detects dangerous force push operations"
+    triggers = ("git",)
+    trigger_args = ("push",)
 
     def matches(self, command: ParsedCommand) -> bool:
         """Check if command is git push with force."""
         return (
             command.command == "git"
-            and "push" in command.args
-            and (
-                "--force" in command.flags
-                or "-f" in command.flags
-                or "--force-with-lease" in command.flags
-            )
+            and "push" in command.arg_set
+            and not command.flag_set.isdisjoint(_PUSH_FORCE_FLAGS)
         )
 
     def analyze(self, command: ParsedCommand) -> RuleMatch:
         """Analyze git push --force for dangers."""
-        has_force_with_lease = "--force-with-lease" in command.flags
+        has_force_with_lease = "--force-with-lease" in command.flag_set
 
         # Check if pushing to main/master
-        is_main_branch = any(
-            arg in ["main", "master", "origin/main", "origin/master"]
-            for arg in command.args
-        )
+        is_main_branch = not command.arg_set.isdisjoint(_MAIN_BRANCHES)
 
         if is_main_branch and not has_force_with_lease:
             danger_level = DangerLevel.CRITICAL
@@ -104,9 +152,9 @@ class GitPushForceRule(Rule):
                 "Use --force-with-lease instead of --force for safer forced pushes. "
                 "Or better yet, avoid force pushing to main branches."
             )
-            safe_alternative = command.raw.replace(
-                "--force", "--force-with-lease"
-            ).replace("-f", "--force-with-lease")
+            safe_alternative = _PUSH_FORCE_FLAG_RE.sub(
+                "--force-with-lease", command.raw
+            )
 
         elif has_force_with_lease:
             danger_level = DangerLevel.MEDIUM
@@ -124,9 +172,9 @@ class GitPushForceRule(Rule):
                 "from other team members."
             )
             suggestion = "Use --force-with-lease instead for safer forced pushes."
-            safe_alternative = command.raw.replace(
-                "--force", "--force-with-lease"
-            ).replace("-f", "--force-with-lease")
+            safe_alternative = _PUSH_FORCE_FLAG_RE.sub(
+                "--force-with-lease", command.raw
+            )
 
         return RuleMatch(
             rule_name=self.name,
@@ -142,65 +190,29 @@ class GitCleanRule(Rule):
 
     name = "git_clean"
     description = "Detects dangerous git clean operations"
+    triggers = ("git",)
+    trigger_args = ("clean",)
 
     def matches(self, command: ParsedCommand) -> bool:
         """Check if command is git clean."""
-        return command.command == "git" and "clean" in command.args
+        return command.command == "git" and "clean" in command.arg_set
 
     def analyze(self, command: ParsedCommand) -> RuleMatch:
         """Analyze git clean for dangers."""
-        has_force = "-f" in command.flags or "--force" in command.flags
-        has_d = "-d" in command.flags
-        has_x = "-x" in command.flags or "-X" in command.flags
-
-        # Combined flags like -fd, -fdx
-        combined_flags = "".join(
-            [f for f in command.flags if f.startswith("-") and not f.startswith("--")]
-        )
-        if "f" in combined_flags:
-            has_force = True
-        if "d" in combined_flags:
-            has_d = True
-        if "x" in combined_flags or "X" in combined_flags:
-            has_x = True
-
-        if has_force and has_d and has_x:
-            danger_level = DangerLevel.CRITICAL
-            message = (
-                "This will permanently delete ALL untracked files and directories, "
-                "including ignored files. This cannot be undone!"
+        # has_any_flag also finds combined flags like -fd, -fdx
+        has_force = command.has_any_flag(_CLEAN_FORCE_FLAGS)
+        has_d = command.has_flag("-d")
+        has_x = command.has_any_flag(_CLEAN_IGNORED_FLAGS)
+
+        # Without -f git clean refuses to delete anything
+        if not has_force:
+            return shared_match(
+                self.name,
+                DangerLevel.LOW,
+                "Use -f flag to actually delete files (dry run mode).",
             )
-            suggestion = "Run 'git clean -fdxn' first to see what would be deleted."
-            safe_alternative = "git clean -fdxn"
 
-        elif has_force and has_d:
-            danger_level = DangerLevel.HIGH
-            message = (
-                "This will permanently delete all untracked files and directories. "
-                "This cannot be undone!"
-            )
-            suggestion = "Run 'git clean -fdn' first to preview what will be deleted."
-            safe_alternative = "git clean -fdn"
-
-        elif has_force:
-            danger_level = DangerLevel.MEDIUM
-            message = "This will permanently delete untracked files."
-            suggestion = "Run 'git clean -fn' first to see what would be deleted."
-            safe_alternative = "git clean -fn"
-
-        else:
-            danger_level = DangerLevel.LOW
-            message = "Use -f flag to actually delete files (dry run mode)."
-            suggestion = None
-            safe_alternative = None
-
-        return RuleMatch(
-            rule_name=self.name,
-            danger_level=danger_level,
-            message=message,
-            suggestion=suggestion,
-            safe_alternative=safe_alternative,
-        )
+        return shared_match(self.name, *_FORCED_CLEAN_OUTCOMES[(has_d, has_x)])
 
 
 class GitBranchDeleteRule(Rule):
@@ -208,13 +220,18 @@ class GitBranchDeleteRule(Rule):
 
     name = "git_branch_delete"
     description = "Detects force deletion of git branches"
+    triggers = ("git",)
+    trigger_args = ("branch",)
 
     def matches(self, command: ParsedCommand) -> bool:
         """Check if command is git branch -D."""
         return (
             command.command == "git"
-            and "branch" in command.args
-            and ("-D" in command.flags or "--delete --force" in " ".join(command.flags))
+            and "branch" in command.arg_set
+            and (
+                "-D" in command.flag_set
+                or "--delete --force" in " ".join(command.flags)
+            )
         )
 
     def analyze(self, command: ParsedCommand) -> RuleMatch:
@@ -227,7 +244,7 @@ class GitBranchDeleteRule(Rule):
         suggestion = (
             "Use 'git branch -d' (lowercase) to safely delete only merged branches."
         )
-        safe_alternative = command.raw.replace("-D", "-d")
+        safe_alternative = _BRANCH_FORCE_DELETE_RE.sub("-d", command.raw)
 
         return RuleMatch(
             rule_name=self.name,
@@ -2,7 +2,7 @@
 Rule registry for managing and applying safety rules.
 """
 
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from safe_cli.core.parser import ParsedCommand
 from safe_cli.rules.base import Rule, RuleMatch
@@ -34,6 +34,32 @@ from safe_cli.rules.system import (
 )
 from safe_cli.utils.constants import DangerLevel
 
+# Rules keep no per-command state, so every registry shares these instances
+_DEFAULT_RULES: Tuple[Rule, ...] = (
+    # Filesystem rules
+    RmRule(),
+    MvRule(),
+    CpRule(),
+    ChmodRule(),
+    ChownRule(),
+    # Git rules
+    GitResetRule(),
+    GitPushForceRule(),
+    GitCleanRule(),
+    GitBranchDeleteRule(),
+    # Docker rules
+    DockerSystemPruneRule(),
+    DockerRmRule(),
+    DockerRmiRule(),
+    DockerVolumePruneRule(),
+    # System rules
+    SudoRule(),
+    DdRule(),
+    KillRule(),
+    ShutdownRule(),
+    MkfsRule(),
+)
+
 
 class RuleRegistry:
     """Registry for managing safety rules."""
@@ -41,35 +67,25 @@ class RuleRegistry:
     def __init__(self) -> None:
         """Initialize the registry with default rules."""
         self._rules: List[Rule] = []
+        self._by_name: Dict[str, Rule] = {}
+        self._version = 0
+
+        # Index of rules by the command names that can trigger them, so
+        # matching only has to consult rules that could possibly apply
+        self._by_command: Dict[str, List[Rule]] = {}
+        self._prefixed: List[Rule] = []
+        self._untriggered: List[Rule] = []
+
+        # Every prefix of the prefixed rules, so one startswith call tells
+        # whether any of them can apply
+        self._all_prefixes: Tuple[str, ...] = ()
+
         self._register_default_rules()
 
     def _register_default_rules(self) -> None:
         """Register all default safety rules."""
-        # Filesystem rules
-        self.register(RmRule())
-        self.register(MvRule())
-        self.register(CpRule())
-        self.register(ChmodRule())
-        self.register(ChownRule())
-
-        # Git rules
-        self.register(GitResetRule())
-        self.register(GitPushForceRule())
-        self.register(GitCleanRule())
-        self.register(GitBranchDeleteRule())
-
-        # Docker rules
-        self.register(DockerSystemPruneRule())
-        self.register(DockerRmRule())
-        self.register(DockerRmiRule())
-        self.register(DockerVolumePruneRule())
-
-        # System rules
-        self.register(SudoRule())
-        self.register(DdRule())
-        self.register(KillRule())
-        self.register(ShutdownRule())
-        self.register(MkfsRule())
+        for rule in _DEFAULT_RULES:
+            self.register(rule)
 
     def register(self, rule: Rule) -> None:
         """
@@ -82,10 +98,46 @@ class RuleRegistry:
             raise TypeError(f"Expected Rule instance, got {type(rule)}")
 
         # Check for duplicate names
-        if any(r.name == rule.name for r in self._rules):
+        if rule.name in self._by_name:
             raise ValueError(f"Rule with name '{rule.name}' already registered")
 
         self._rules.append(rule)
+        self._by_name[rule.name] = rule
+        self._index(rule)
+        self._version += 1
+
+    def _index(self, rule: Rule) -> None:
+        """
+        Add a rule to the trigger index.
+
+        Rules without declared triggers are added to every command bucket
+        so that bucket order always follows registration order.
+
+        Args:
+            rule: Rule to index
+        """
+        if rule.trigger_prefixes:
+            self._prefixed.append(rule)
+            self._all_prefixes += rule.trigger_prefixes
+
+        if rule.triggers:
+            for trigger in rule.triggers:
+                bucket = self._by_command.setdefault(trigger, list(self._untriggered))
+                if rule not in bucket:
+                    bucket.append(rule)
+        elif not rule.trigger_prefixes:
+            self._untriggered.append(rule)
+            for bucket in self._by_command.values():
+                bucket.append(rule)
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the trigger index from the registered rules."""
+        self._by_command = {}
+        self._prefixed = []
+        self._untriggered = []
+        self._all_prefixes = ()
+        for rule in self._rules:
+            self._index(rule)
 
     def unregister(self, rule_name: str) -> bool:
         """
@@ -97,11 +149,19 @@ class RuleRegistry:
         Returns:
             True if rule was found and removed, False otherwise
         """
-        for i, rule in enumerate(self._rules):
-            if rule.name == rule_name:
-                self._rules.pop(i)
-                return True
-        return False
+        rule = self._by_name.pop(rule_name, None)
+        if rule is None:
+            return False
+
+        self._rules.remove(rule)
+        self._rebuild_index()
+        self._version += 1
+        return True
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the set of registered rules changes."""
+        return self._version
 
     def get_rule(self, rule_name: str) -> Optional[Rule]:
         """
@@ -113,10 +173,7 @@ class RuleRegistry:
         Returns:
             Rule if found, None otherwise
         """
-        for rule in self._rules:
-            if rule.name == rule_name:
-                return rule
-        return None
+        return self._by_name.get(rule_name)
 
     def get_all_rules(self) -> List[Rule]:
         """
@@ -127,6 +184,22 @@ class RuleRegistry:
         """
         return self._rules.copy()
 
+    def has_candidates(self, command_name: str) -> bool:
+        """
+        Check whether any registered rule could match a command name.
+
+        Args:
+            command_name: Command name (first token) to check
+
+        Returns:
+            False if no rule can possibly match, True otherwise
+        """
+        return (
+            bool(self._untriggered)
+            or command_name in self._by_command
+            or command_name.startswith(self._all_prefixes)
+        )
+
     def find_matching_rules(self, command: ParsedCommand) -> List[Rule]:
         """
         Find all rules that match the command.
@@ -137,7 +210,31 @@ class RuleRegistry:
         Returns:
             List of matching rules
         """
-        return [rule for rule in self._rules if rule.matches(command)]
+        return [rule for rule in self._candidates(command) if rule.matches(command)]
+
+    def _candidates(self, command: ParsedCommand) -> Iterator[Rule]:
+        """
+        Yield the rules whose triggers allow them to apply to the command.
+
+        Args:
+            command: Parsed command to check
+
+        Yields:
+            Candidate rules, in registration order, then prefix-triggered rules
+        """
+        name = command.command
+
+        for rule in self._by_command.get(name, self._untriggered):
+            if rule.trigger_args and not command.arg_set.issuperset(rule.trigger_args):
+                continue
+            yield rule
+
+        if not name.startswith(self._all_prefixes):
+            return
+
+        for rule in self._prefixed:
+            if name.startswith(rule.trigger_prefixes) and name not in rule.triggers:
+                yield rule
 
     def analyze_command(self, command: ParsedCommand) -> List[RuleMatch]:
         """
@@ -149,29 +246,45 @@ class RuleRegistry:
         Returns:
             List of rule matches
         """
-        matching_rules = self.find_matching_rules(command)
-        return [rule.analyze(command) for rule in matching_rules]
-
-    def get_highest_danger_level(self, command: ParsedCommand) -> DangerLevel:
+        results = (
+            rule.analyze_if_matches(command) for rule in self._candidates(command)
+        )
+        return [match for match in results if match is not None]
+
+    def get_highest_danger_level(
+        self,
+        command: ParsedCommand,
+        stop_at: DangerLevel = DangerLevel.CRITICAL,
+    ) -> DangerLevel:
         """
         Get the highest danger level from all matching rules.
 
         Args:
             command: Parsed command to analyze
+            stop_at: Stop analyzing further rules once a match reaches this
+                level, for callers that only care whether it is reached
 
         Returns:
             Highest danger level found, or SAFE if no rules match
         """
-        matches = self.analyze_command(command)
+        highest = DangerLevel.SAFE
+        for rule in self._candidates(command):
+            match = rule.analyze_if_matches(command)
+            if match is None or match.danger_level <= highest:
+                continue
 
-        if not matches:
-            return DangerLevel.SAFE
+            highest = match.danger_level
+            if highest >= stop_at:
+                break
 
-        return max(match.danger_level for match in matches)
+        return highest
 
     def clear(self) -> None:
         """Clear all registered rules."""
         self._rules.clear()
+        self._by_name.clear()
+        self._rebuild_index()
+        self._version += 1
 
     def __len__(self) -> int:
         """Get number of registered rules."""
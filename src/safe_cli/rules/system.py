@@ -2,16 +2,53 @@
 System-level command safety rules.
 """
 
+import re
+
 from safe_cli.core.parser import ParsedCommand
 from safe_cli.rules.base import Rule, RuleMatch
 from safe_cli.utils.constants import DANGEROUS_PATHS, DangerLevel
 
+# SIGKILL flag tokens (with their leading space), dropped for safer alternatives
+_SIGKILL_FLAGS = ("-9", "-KILL", "-SIGKILL")
+_SIGKILL_FLAG_RE = re.compile(r"\s+(?:-9|-KILL|-SIGKILL)(?=\s|$)")
+
+# Commands that are especially destructive when run as root
+_SUDO_DANGEROUS_COMMANDS = frozenset(
+    {"rm", "dd", "mkfs", "fdisk", "parted", "chmod", "chown"}
+)
+
+# DANGEROUS_PATHS without entries that contain another entry: an argument
+# contains some dangerous path exactly when it contains one of these, so the
+# substring scan only needs the shortest ones (currently just '/')
+_SYSTEM_PATH_MARKERS = tuple(
+    path
+    for path in DANGEROUS_PATHS
+    if not any(other != path and other in path for other in DANGEROUS_PATHS)
+)
+
+# Device files that are safe to read from
+_SAFE_DEV_PATHS = ("/dev/zero", "/dev/null", "/dev/random", "/dev/urandom")
+
+# Whole-disk device prefixes that dd must not write to
+_DISK_DEVICE_PREFIXES = ("/dev/sda", "/dev/sdb", "/dev/nvme", "/dev/disk")
+
+_KILL_COMMANDS = frozenset({"kill", "killall"})
+
+# Processes the system or remote access can't survive losing
+_CRITICAL_PROCESSES = frozenset({"init", "systemd", "launchd", "ssh", "sshd"})
+
+_SHUTDOWN_COMMANDS = frozenset({"shutdown", "reboot", "halt", "poweroff"})
+
+# Commands that act immediately instead of scheduling a shutdown
+_IMMEDIATE_SHUTDOWN_COMMANDS = frozenset({"reboot", "halt", "poweroff"})
+
 
 class SudoRule(Rule):
     """Safety rule for sudo commands."""
 
     name = "sudo_command"
     description = "Detects sudo usage with potentially dangerous commands"
+    triggers = ("sudo",)
 
     def matches(self, command: ParsedCommand) -> bool:
         """Check if command uses sudo."""
@@ -23,14 +60,12 @@ class SudoRule(Rule):
         actual_cmd = command.args[0] if command.args else ""
 
         # Check for dangerous command combinations
-        dangerous_commands = ["rm", "dd", "mkfs", "fdisk", "parted", "chmod", "chown"]
-        is_dangerous_cmd = actual_cmd in dangerous_commands
+        is_dangerous_cmd = actual_cmd in _SUDO_DANGEROUS_COMMANDS
 
         # Check if modifying system paths (exclude /dev/zero, /dev/null which are safe sources)
-        safe_dev_paths = ["/dev/zero", "/dev/null", "/dev/random", "/dev/urandom"]
         has_system_path = any(
-            any(path in arg for path in DANGEROUS_PATHS)
-            and not any(safe in arg for safe in safe_dev_paths)
+            any(path in arg for path in _SYSTEM_PATH_MARKERS)
+            and not any(safe in arg for safe in _SAFE_DEV_PATHS)
             for arg in command.args
         )
 
@@ -80,6 +115,7 @@ class DdRule(Rule):
 
     name = "dd_command"
     description = "Detects dangerous dd operations"
+    triggers = ("dd",)
 
     def matches(self, command: ParsedCommand) -> bool:
         """Check if command is dd."""
@@ -88,8 +124,6 @@ class DdRule(Rule):
     def analyze(self, command: ParsedCommand) -> RuleMatch:
         """Analyze dd command for dangers."""
         # Check for dangerous output targets
-        dangerous_of = ["/dev/sda", "/dev/sdb", "/dev/nvme", "/dev/disk"]
-
         of_arg = None
         for arg in command.args:
             if arg.startswith("of="):
@@ -97,9 +131,7 @@ class DdRule(Rule):
                 break
 
         if of_arg:
-            is_dangerous_target = any(
-                of_arg.startswith(dangerous) for dangerous in dangerous_of
-            )
+            is_dangerous_target = of_arg.startswith(_DISK_DEVICE_PREFIXES)
 
             if is_dangerous_target:
                 danger_level = DangerLevel.CRITICAL
@@ -139,37 +171,30 @@ class KillRule(Rule):
 
     name = "kill_command"
     description = "Detects dangerous process kill operations"
+    triggers = ("kill", "killall")
 
     def matches(self, command: ParsedCommand) -> bool:
         """Check if command is kill or killall."""
-        return command.command in ["kill", "killall"]
+        return command.command in _KILL_COMMANDS
 
     def analyze(self, command: ParsedCommand) -> RuleMatch:
         """Analyze kill command for dangers."""
-        has_9 = (
-            "-9" in command.flags
-            or "-KILL" in command.flags
-            or "-SIGKILL" in command.flags
-        )
+        has_9 = not command.flag_set.isdisjoint(_SIGKILL_FLAGS)
         is_killall = command.command == "killall"
 
         # Check for dangerous process names
-        dangerous_processes = ["init", "systemd", "launchd", "ssh", "sshd"]
-        targets = command.args if is_killall else []
-        has_dangerous_target = any(proc in dangerous_processes for proc in targets)
+        targets = command.args if is_killall else ()
+        has_dangerous_target = not _CRITICAL_PROCESSES.isdisjoint(targets)
 
         if has_9 and has_dangerous_target:
             danger_level = DangerLevel.CRITICAL
             message = (
-                f"Force killing critical system processes like {targets} can crash your system! "
+                f"Force killing critical system processes like {', '.join(targets)} "
+                "can crash your system! "
                 "This will immediately terminate the process without cleanup."
             )
             suggestion = "Don't kill critical system processes. If you must, try without -9 first."
-            safe_alternative = (
-                command.raw.replace("-9", "")
-                .replace("-KILL", "")
-                .replace("-SIGKILL", "")
-            )
+            safe_alternative = _SIGKILL_FLAG_RE.sub("", command.raw)
 
         elif has_9 and is_killall:
             danger_level = DangerLevel.HIGH
@@ -178,11 +203,7 @@ class KillRule(Rule):
                 "They won't have a chance to clean up or save state."
             )
             suggestion = "Try without -9 first to allow graceful termination."
-            safe_alternative = (
-                command.raw.replace("-9", "")
-                .replace("-KILL", "")
-                .replace("-SIGKILL", "")
-            )
+            safe_alternative = _SIGKILL_FLAG_RE.sub("", command.raw)
 
         elif has_9:
             danger_level = DangerLevel.MEDIUM
@@ -191,11 +212,7 @@ class KillRule(Rule):
                 "The process will be terminated immediately without cleanup."
             )
             suggestion = "Try regular kill first (SIGTERM) to allow graceful shutdown."
-            safe_alternative = (
-                command.raw.replace("-9", "")
-                .replace("-KILL", "")
-                .replace("-SIGKILL", "")
-            )
+            safe_alternative = _SIGKILL_FLAG_RE.sub("", command.raw)
 
         elif is_killall:
             danger_level = DangerLevel.MEDIUM
@@ -225,17 +242,18 @@ class ShutdownRule(Rule):
 
     name = "shutdown_command"
     description = "Detects system shutdown/reboot operations"
+    triggers = ("shutdown", "reboot", "halt", "poweroff")
 
     def matches(self, command: ParsedCommand) -> bool:
         """Check if command is shutdown or reboot."""
-        return command.command in ["shutdown", "reboot", "halt", "poweroff"]
+        return command.command in _SHUTDOWN_COMMANDS
 
     def analyze(self, command: ParsedCommand) -> RuleMatch:
         """Analyze shutdown command for dangers."""
         is_immediate = (
-            "now" in command.args
-            or "-h" in command.flags
-            or command.command in ["reboot", "halt", "poweroff"]
+            "now" in command.arg_set
+            or "-h" in command.flag_set
+            or command.command in _IMMEDIATE_SHUTDOWN_COMMANDS
         )
 
         if is_immediate:
@@ -269,15 +287,12 @@ class MkfsRule(Rule):
 
     name = "mkfs_command"
     description = "Detects filesystem formatting operations"
+    trigger_prefixes = ("mkfs",)
 
     def matches(self, command: ParsedCommand) -> bool:
         """Check if command is mkfs or variants."""
-        return command.command.startswith("mkfs") or command.command in [
-            "mkfs.ext4",
-            "mkfs.ext3",
-            "mkfs.ntfs",
-            "mkfs.vfat",
-        ]
+        # Covers every variant such as mkfs.ext4 and mkfs.vfat
+        return command.command.startswith("mkfs")
 
     def analyze(self, command: ParsedCommand) -> RuleMatch:
         """Analyze mkfs command for dangers."""
@@ -2,7 +2,23 @@
 User interface components for safe-cli.
 """
 
-from safe_cli.ui.display import DisplayFormatter
-from safe_cli.ui.prompts import PromptResponse, UserPrompt
+from importlib import import_module
+from typing import Any
 
-__all__ = ["DisplayFormatter", "UserPrompt", "PromptResponse"]
+# Exports are resolved on first access, so using the display formatter
+# doesn't also load questionary for the interactive prompts
+_EXPORTS = {
+    "DisplayFormatter": "safe_cli.ui.display",
+    "UserPrompt": "safe_cli.ui.prompts",
+    "PromptResponse": "safe_cli.ui.prompts",
+}
+
+__all__ = ("DisplayFormatter", "UserPrompt", "PromptResponse")
+
+
+def __getattr__(name: str) -> Any:
+    """Import UI exports on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
@@ -2,13 +2,40 @@
 Display formatting for analysis results.
 """
 
+from typing import Any, Dict, List, Union
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
 from safe_cli.core.analyzer import AnalysisResult
 from safe_cli.utils.constants import DangerLevel
 
+# List item prefixes for warnings/suggestions and alternatives
+_BULLET = "  • "
+_ARROW = "  → "
+
+# Danger level lines only depend on the level, so build them once
+_DANGER_HEADERS: Dict[DangerLevel, Text] = {
+    level: Text.assemble(
+        ("Danger Level:", "bold"),
+        " ",
+        (f"{level.name} {level.emoji}", level.color),
+        "\n",
+    )
+    for level in DangerLevel
+}
+
+_NO_CONCERNS_LINE = Text.assemble(("✅ No safety concerns detected.", "green"), "\n")
+
+# Panel options for the levels whose primary warning is shown in a panel
+_WARNING_PANELS: Dict[DangerLevel, Dict[str, Any]] = {
+    level: {"title": "⚠️  Warning", "border_style": level.color, "title_align": "left"}
+    for level in DangerLevel
+    if level.requires_confirmation
+}
+
 
 class DisplayFormatter:
     """Formats analysis results for display."""
@@ -22,6 +49,9 @@ class DisplayFormatter:
         """
         self.console = console
 
+        # Lines of the analysis being displayed, printed together by _flush()
+        self._lines: List[Text] = []
+
     def display_analysis(self, result: AnalysisResult, dry_run: bool = False) -> None:
         """
         Display complete analysis results.
@@ -31,9 +61,16 @@ class DisplayFormatter:
             dry_run: Whether this is a dry run
         """
         if dry_run:
-            self.console.print(
-                "\n[bold cyan]🔍 Dry Run Mode - Analysis Only[/bold cyan]\n"
-            )
+            self._write("\n[bold cyan]🔍 Dry Run Mode - Analysis Only[/bold cyan]\n")
+
+        # Safe commands with nothing to suggest only need the header
+        if result.danger_level is DangerLevel.SAFE and not (
+            result.suggestions or result.safe_alternatives
+        ):
+            self._display_header(result)
+            self._write(_NO_CONCERNS_LINE)
+            self._flush()
+            return
 
         # Command and danger level
         self._display_header(result)
@@ -49,62 +86,73 @@ class DisplayFormatter:
         if result.safe_alternatives:
             self._display_alternatives(result)
 
+        self._flush()
+
     def _display_header(self, result: AnalysisResult) -> None:
         """Display command and danger level."""
-        danger_color = result.danger_level.color
-        danger_emoji = result.danger_level.emoji
-
-        self.console.print(f"[bold]Command:[/bold] {result.command.raw}")
-        self.console.print(
-            f"[bold]Danger Level:[/bold] [{danger_color}]"
-            f"{result.danger_level.name} {danger_emoji}[/{danger_color}]\n"
-        )
+        # Command text is user input, so keep it out of markup parsing
+        self._write(Text.assemble(("Command:", "bold"), " ", result.command.raw))
+        self._write(_DANGER_HEADERS[result.danger_level])
 
     def _display_warnings(self, result: AnalysisResult) -> None:
         """Display warning messages."""
-        if result.danger_level == DangerLevel.SAFE:
-            self.console.print("[green]✅ No safety concerns detected.[/green]\n")
+        level = result.danger_level
+        if level is DangerLevel.SAFE:
+            self._write(_NO_CONCERNS_LINE)
             return
 
-        danger_color = result.danger_level.color
+        danger_color = level.color
 
         # Primary warning in panel for emphasis
-        if result.danger_level.requires_confirmation:
-            panel = Panel(
-                result.primary_warning,
-                title="⚠️  Warning",
-                border_style=danger_color,
-                title_align="left",
-            )
+        if level.requires_confirmation:
+            panel = Panel(Text(result.primary_warning), **_WARNING_PANELS[level])
+            self._flush()
             self.console.print(panel)
         else:
-            self.console.print(
-                f"[{danger_color}]⚠️  {result.primary_warning}[/{danger_color}]"
-            )
+            self._write(Text("⚠️  " + result.primary_warning, style=danger_color))
 
         # Additional warnings if any
-        if len(result.all_warnings) > 1:
-            self.console.print(
+        additional_warnings = result.additional_warnings
+        if additional_warnings:
+            self._write(
                 f"\n[bold {danger_color}]Additional Concerns:[/bold {danger_color}]"
             )
-            for warning in result.all_warnings[1:]:
-                self.console.print(f"  • {warning}")
+            for warning in additional_warnings:
+                self._write(Text(_BULLET + warning))
 
-        self.console.print()
+        self._write()
 
     def _display_suggestions(self, result: AnalysisResult) -> None:
         """Display suggestions."""
-        self.console.print("[bold cyan]💡 Suggestions:[/bold cyan]")
+        self._write("[bold cyan]💡 Suggestions:[/bold cyan]")
         for suggestion in result.suggestions:
-            self.console.print(f"  • {suggestion}")
-        self.console.print()
+            self._write(Text(_BULLET + suggestion))
+        self._write()
 
     def _display_alternatives(self, result: AnalysisResult) -> None:
         """Display safe alternatives."""
-        self.console.print("[bold green]✅ Safe Alternatives:[/bold green]")
+        self._write("[bold green]✅ Safe Alternatives:[/bold green]")
         for alt in result.safe_alternatives:
-            self.console.print(f"  → [green]{alt}[/green]")
-        self.console.print()
+            self._write(Text.assemble(_ARROW, (alt, "green")))
+        self._write()
+
+    def _write(self, line: Union[str, Text] = "") -> None:
+        """
+        Queue a line of the analysis display.
+
+        Args:
+            line: Console markup, rendered as console.print would, or Text
+                that is used as-is
+        """
+        if isinstance(line, str):
+            line = self.console.render_str(line)
+        self._lines.append(line)
+
+    def _flush(self) -> None:
+        """Print all queued lines in a single console call."""
+        if self._lines:
+            self.console.print(Text("\n").join(self._lines))
+            self._lines.clear()
 
     def display_comparison(self, original: str, alternative: str) -> None:
         """
@@ -118,14 +166,16 @@ class DisplayFormatter:
         table.add_column("Original", style="red")
         table.add_column("Safe Alternative", style="green")
 
-        table.add_row(original, alternative)
+        # Commands are user input, so keep them out of markup parsing
+        table.add_row(Text(original), Text(alternative))
 
-        self.console.print(table)
-        self.console.print()
+        # The empty string renders the blank line after the table in the
+        # same call
+        self.console.print(table, "")
 
     def display_execution_start(self, command: str) -> None:
         """Display that execution is starting."""
-        self.console.print(f"\n[cyan]▶️  Executing:[/cyan] {command}")
+        self.console.print(Text.assemble("\n", ("▶️  Executing:", "cyan"), " ", command))
 
     def display_execution_complete(self, success: bool) -> None:
         """Display execution completion status."""
@@ -140,8 +190,9 @@ class DisplayFormatter:
 
     def display_error(self, message: str) -> None:
         """Display an error message."""
-        self.console.print(f"[red]❌ Error:[/red] {message}\n")
+        # Messages can quote the user's command, so don't parse them as markup
+        self.console.print(Text.assemble(("❌ Error:", "red"), " ", message, "\n"))
 
     def display_info(self, message: str) -> None:
         """Display an info message."""
-        self.console.print(f"[cyan]ℹ️  {message}[/cyan]\n")
+        self.console.print(Text.assemble(("ℹ️  " + message, "cyan"), "\n"))
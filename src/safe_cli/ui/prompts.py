@@ -5,10 +5,9 @@ Interactive prompts for user decisions.
 from __future__ import annotations
 
 from enum import Enum
+from typing import Sequence
 
-import questionary
 from rich.console import Console
-from rich.prompt import Confirm
 
 from safe_cli.core.analyzer import AnalysisResult
 from safe_cli.utils.constants import DangerLevel
@@ -49,6 +48,9 @@ class UserPrompt:
         Returns:
             Selected choice
         """
+        # questionary loads prompt_toolkit, so only pay for it when asking
+        import questionary
+
         result: str | None = questionary.select(
             question, choices=choices, default=choices[default]
         ).ask()
@@ -129,6 +131,8 @@ class UserPrompt:
 
     def _high_prompt(self, result: AnalysisResult) -> PromptResponse:
         """Prompt for high danger commands."""
+        from rich.prompt import Confirm
+
         self.console.print(
             "\n[bold red]⚠️  HIGH RISK - Proceed with caution![/bold red]"
         )
@@ -161,6 +165,8 @@ class UserPrompt:
 
     def _medium_prompt(self, result: AnalysisResult) -> PromptResponse:
         """Prompt for medium danger commands."""
+        from rich.prompt import Confirm
+
         if result.has_safe_alternatives:
             choice = self._prompt_choice(
                 "[yellow]⚠️  How would you like to proceed?[/yellow]",
@@ -180,7 +186,9 @@ class UserPrompt:
             else:
                 return PromptResponse.ABORT
 
-    def choose_alternative(self, alternatives: list[str]) -> tuple[bool, str | None]:
+    def choose_alternative(
+        self, alternatives: Sequence[str]
+    ) -> tuple[bool, str | None]:
         """
         Let user choose from safe alternatives.
 
@@ -190,7 +198,7 @@ class UserPrompt:
         Returns:
             Tuple of (should_use_alternative, chosen_alternative)
         """
-        choices = alternatives + ["Use original command", "Abort"]
+        choices = [*alternatives, "Use original command", "Abort"]
 
         choice = self._prompt_choice(
             "[bold green]Available Safe Alternatives:[/bold green]", choices, default=0
@@ -14,84 +14,96 @@ class DangerLevel(Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
+    # Position in the declaration order above, so comparisons are a single
+    # int compare instead of a list search
+    _rank: int
+
+    def __init__(self, value: str) -> None:
+        self._rank = len(type(self).__members__)
+
     @property
     def color(self) -> str:
         """Get Rich color for this danger level."""
-        colors = {
-            DangerLevel.SAFE: "green",
-            DangerLevel.LOW: "yellow",
-            DangerLevel.MEDIUM: "yellow",
-            DangerLevel.HIGH: "red",
-            DangerLevel.CRITICAL: "bold red",
-        }
-        return colors[self]
+        return _COLORS[self]
 
     @property
     def emoji(self) -> str:
         """Get emoji for this danger level."""
-        emojis = {
-            DangerLevel.SAFE: "✅",
-            DangerLevel.LOW: "⚡",
-            DangerLevel.MEDIUM: "⚠️",
-            DangerLevel.HIGH: "🔥",
-            DangerLevel.CRITICAL: "💀",
-        }
-        return emojis[self]
+        return _EMOJIS[self]
 
     @property
     def requires_confirmation(self) -> bool:
         """Whether this level requires user confirmation."""
-        return self in [DangerLevel.HIGH, DangerLevel.CRITICAL]
+        return self._rank >= DangerLevel.HIGH._rank
 
     def __lt__(self, other: "DangerLevel") -> bool:
         """Compare danger levels."""
         if not isinstance(other, DangerLevel):
             return NotImplemented
-
-        order = [
-            DangerLevel.SAFE,
-            DangerLevel.LOW,
-            DangerLevel.MEDIUM,
-            DangerLevel.HIGH,
-            DangerLevel.CRITICAL,
-        ]
-        return order.index(self) < order.index(other)
+        return self._rank < other._rank
 
     def __le__(self, other: "DangerLevel") -> bool:
         """Compare danger levels."""
-        return self == other or self < other
+        if not isinstance(other, DangerLevel):
+            return NotImplemented
+        return self._rank <= other._rank
 
     def __gt__(self, other: "DangerLevel") -> bool:
         """Compare danger levels."""
-        return not self <= other
+        if not isinstance(other, DangerLevel):
+            return NotImplemented
+        return self._rank > other._rank
 
     def __ge__(self, other: "DangerLevel") -> bool:
         """Compare danger levels."""
-        return not self < other
-
-
-# Common dangerous flags
-RECURSIVE_FLAGS = ["-r", "-R", "--recursive"]
-FORCE_FLAGS = ["-f", "-F", "--force"]
-ALL_FLAGS = ["-a", "-A", "--all"]
-VERBOSE_FLAGS = ["-v", "--verbose"]
-INTERACTIVE_FLAGS = ["-i", "-I", "--interactive"]
-
-# Dangerous paths
-DANGEROUS_PATHS = [
-    "/",
-    "/bin",
-    "/boot",
-    "/dev",
-    "/etc",
-    "/lib",
-    "/proc",
-    "/root",
-    "/sbin",
-    "/sys",
-    "/usr",
-    "/var",
-]
+        if not isinstance(other, DangerLevel):
+            return NotImplemented
+        return self._rank >= other._rank
+
+
+# Lookup tables for the DangerLevel properties, built once rather than on
+# every access
+_COLORS = {
+    DangerLevel.SAFE: "green",
+    DangerLevel.LOW: "yellow",
+    DangerLevel.MEDIUM: "yellow",
+    DangerLevel.HIGH: "red",
+    DangerLevel.CRITICAL: "bold red",
+}
+
+_EMOJIS = {
+    DangerLevel.SAFE: "✅",
+    DangerLevel.LOW: "⚡",
+    DangerLevel.MEDIUM: "⚠️",
+    DangerLevel.HIGH: "🔥",
+    DangerLevel.CRITICAL: "💀",
+}
+
+
+# Common dangerous flags (sets, since they're only used for membership tests)
+RECURSIVE_FLAGS = frozenset({"-r", "-R", "--recursive"})
+FORCE_FLAGS = frozenset({"-f", "-F", "--force"})
+ALL_FLAGS = frozenset({"-a", "-A", "--all"})
+VERBOSE_FLAGS = frozenset({"-v", "--verbose"})
+INTERACTIVE_FLAGS = frozenset({"-i", "-I", "--interactive"})
+
+# Dangerous paths (a set: rules only test membership or derive prefixes)
+DANGEROUS_PATHS = frozenset(
+    {
+        "/",
+        "/bin",
+        "/boot",
+        "/dev",
+        "/etc",
+        "/lib",
+        "/proc",
+        "/root",
+        "/sbin",
+        "/sys",
+        "/usr",
+        "/var",
+    }
+)
 
 # User paths that need caution
 USER_IMPORTANT_PATHS = [
@@ -3,12 +3,47 @@ Tests for command analyzer.
 """
 
 import pytest
-from safe_cli.core.analyzer import AnalysisResult, CommandAnalyzer
-from safe_cli.core.parser import CommandParser
+from safe_cli.core.analyzer import (
+    _CACHEABLE_MAX_LENGTH,
+    AnalysisResult,
+    CommandAnalyzer,
+)
+from safe_cli.core.parser import CommandParser, ParsedCommand
+from safe_cli.rules.base import Rule, RuleMatch
 from safe_cli.rules.registry import RuleRegistry
 from safe_cli.utils.constants import DangerLevel
 
 
+class CountingRule(Rule):
+    """Rule that counts how many times it analyzed a command."""
+
+    name = "counting_rule"
+    description = "Test rule"
+    triggers = ("rm",)
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def matches(self, command: ParsedCommand) -> bool:
+        return command.command == "rm"
+
+    def analyze(self, command: ParsedCommand) -> RuleMatch:
+        self.calls += 1
+        return RuleMatch(
+            rule_name=self.name,
+            danger_level=DangerLevel.LOW,
+            message="Counted",
+        )
+
+
+def counting_analyzer(rule: CountingRule, cache_size: int = 256) -> CommandAnalyzer:
+    """Create an analyzer whose only rule is the given counting rule."""
+    registry = RuleRegistry()
+    registry.clear()
+    registry.register(rule)
+    return CommandAnalyzer(registry=registry, cache_size=cache_size)
+
+
 class TestCommandAnalyzer:
     """Test suite for CommandAnalyzer."""
 
@@ -37,6 +72,10 @@ class TestCommandAnalyzer:
 
         assert analyzer.registry is registry
 
+    def test_analyzers_share_default_registry(self) -> None:
+        """Test that the default registry is built once and shared."""
+        assert CommandAnalyzer().registry is CommandAnalyzer().registry
+
     def test_analyze_safe_command(
         self, parser: CommandParser, analyzer: CommandAnalyzer
     ) -> None:
@@ -116,7 +155,7 @@ class TestCommandAnalyzer:
         cmd = parser.parse("rm -rf /tmp")
         result = analyzer.analyze(cmd)
 
-        assert isinstance(result.all_warnings, list)
+        assert isinstance(result.all_warnings, tuple)
         assert len(result.all_warnings) > 0
         assert result.primary_warning in result.all_warnings
 
@@ -127,7 +166,7 @@ class TestCommandAnalyzer:
         cmd = parser.parse("rm -rf /tmp")
         result = analyzer.analyze(cmd)
 
-        assert isinstance(result.suggestions, list)
+        assert isinstance(result.suggestions, tuple)
         assert result.has_suggestions
         assert len(result.suggestions) > 0
 
@@ -138,7 +177,7 @@ class TestCommandAnalyzer:
         cmd = parser.parse("rm -rf /tmp")
         result = analyzer.analyze(cmd)
 
-        assert isinstance(result.safe_alternatives, list)
+        assert isinstance(result.safe_alternatives, tuple)
         assert result.has_safe_alternatives
         assert len(result.safe_alternatives) > 0
 
@@ -187,6 +226,22 @@ class TestCommandAnalyzer:
         assert len(results) == 3
         assert all(isinstance(r, AnalysisResult) for r in results)
 
+    def test_analyze_batch_with_workers(
+        self, parser: CommandParser, analyzer: CommandAnalyzer
+    ) -> None:
+        """Test that a parallel batch matches serial analysis."""
+        commands = [
+            parser.parse(raw)
+            for raw in ("rm -rf /", "ls -la", "git push --force", "chmod 777 x") * 10
+        ]
+
+        results = analyzer.analyze_batch(commands, workers=2)
+
+        assert [r.danger_level for r in results] == [
+            analyzer.analyze(cmd).danger_level for cmd in commands
+        ]
+        assert all(r.command is cmd for r, cmd in zip(results, commands))
+
     def test_get_summary(
         self, parser: CommandParser, analyzer: CommandAnalyzer
     ) -> None:
@@ -252,6 +307,82 @@ class TestCommandAnalyzer:
         # Should be CRITICAL (highest level)
         assert result.danger_level == DangerLevel.CRITICAL
 
+    def test_repeated_command_reuses_rule_matches(self, parser: CommandParser) -> None:
+        """Test that analyzing the same command twice reuses rule matches."""
+        rule = CountingRule()
+        analyzer = counting_analyzer(rule)
+        first = analyzer.analyze(parser.parse("rm file.txt"))
+        second = analyzer.analyze(parser.parse("rm file.txt"))
+
+        assert second.matches is first.matches
+        assert rule.calls == 1
+
+    def test_clear_cache_reanalyzes(self, parser: CommandParser) -> None:
+        """Test that commands are analyzed again after clear_cache()."""
+        rule = CountingRule()
+        analyzer = counting_analyzer(rule)
+        analyzer.analyze(parser.parse("rm file.txt"))
+
+        analyzer.clear_cache()
+        analyzer.analyze(parser.parse("rm file.txt"))
+
+        assert rule.calls == 2
+
+    def test_cache_invalidated_when_rules_change(self, parser: CommandParser) -> None:
+        """Test that registry changes are picked up by cached analyzers."""
+
+        class OtherRule(CountingRule):
+            name = "other_rule"
+
+        rule = CountingRule()
+        analyzer = counting_analyzer(rule)
+        analyzer.analyze(parser.parse("rm file.txt"))
+
+        analyzer.registry.register(OtherRule())
+        result = analyzer.analyze(parser.parse("rm file.txt"))
+
+        assert rule.calls == 2
+        assert len(result.matches) == 2
+
+        analyzer.registry.unregister("other_rule")
+        result = analyzer.analyze(parser.parse("rm file.txt"))
+
+        assert rule.calls == 3
+        assert len(result.matches) == 1
+
+    def test_command_substitution_cached(self, parser: CommandParser) -> None:
+        """Test that commands with substitutions are cached by their text."""
+        rule = CountingRule()
+        analyzer = counting_analyzer(rule)
+        first = analyzer.analyze(parser.parse("rm $(cat files.txt)"))
+        second = analyzer.analyze(parser.parse("rm $(cat files.txt)"))
+
+        assert second.matches is first.matches
+        assert rule.calls == 1
+
+    def test_long_command_not_cached(self, parser: CommandParser) -> None:
+        """Test that very long command strings are analyzed every time."""
+        rule = CountingRule()
+        analyzer = counting_analyzer(rule)
+        raw = "rm " + "x" * _CACHEABLE_MAX_LENGTH
+        analyzer.analyze(parser.parse(raw))
+        analyzer.analyze(parser.parse(raw))
+
+        assert rule.calls == 2
+
+    def test_cache_is_bounded(self, parser: CommandParser) -> None:
+        """Test that the cache evicts the least recently used commands."""
+        rule = CountingRule()
+        analyzer = counting_analyzer(rule, cache_size=2)
+        for name in ("a.txt", "b.txt", "c.txt"):
+            analyzer.analyze(parser.parse(f"rm {name}"))
+
+        analyzer.analyze(parser.parse("rm c.txt"))
+        assert rule.calls == 3
+
+        analyzer.analyze(parser.parse("rm a.txt"))
+        assert rule.calls == 4
+
     def test_command_preserved_in_result(
         self, parser: CommandParser, analyzer: CommandAnalyzer
     ) -> None:
@@ -283,6 +414,24 @@ class TestAnalysisResultProperties:
 
         assert result.is_safe
 
+    def test_additional_warnings(self) -> None:
+        """Test additional_warnings holds the warnings after the primary one."""
+        from safe_cli.core.parser import ParsedCommand
+
+        cmd = ParsedCommand("rm -rf /", ["rm", "-rf", "/"], "rm", ["/"], ["-rf"])
+        result = AnalysisResult(
+            command=cmd,
+            danger_level=DangerLevel.CRITICAL,
+            matches=(),
+            primary_warning="Deletes everything",
+            all_warnings=("Deletes everything", "No recovery possible"),
+            suggestions=(),
+            safe_alternatives=(),
+        )
+
+        assert result.additional_warnings == ("No recovery possible",)
+        assert result.additional_warnings is result.additional_warnings
+
     def test_is_safe_for_low_level(self) -> None:
         """Test is_safe property for LOW level."""
         from safe_cli.core.parser import ParsedCommand
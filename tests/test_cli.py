@@ -89,16 +89,25 @@ class TestCLI:
 
     def test_complex_command(self, runner: CliRunner) -> None:
         """Test complex command with multiple arguments."""
-        result = runner.invoke(app, ["git", "commit", "-am", "test message"])
+        result = runner.invoke(
+            app, ["--dry-run", "git", "commit", "-am", "test message"]
+        )
 
-        assert "git commit -am" in result.stdout
+        assert "git commit -am 'test message'" in result.stdout
 
     def test_quoted_arguments(self, runner: CliRunner) -> None:
         """Test command with quoted arguments."""
         result = runner.invoke(app, ["echo", "hello world"])
 
         assert result.exit_code == 0
-        assert "echo hello world" in result.stdout
+        assert "echo 'hello world'" in result.stdout
+
+    def test_single_argument_is_command_line(self, runner: CliRunner) -> None:
+        """Test that a single quoted argument is parsed as a whole command."""
+        result = runner.invoke(app, ["--dry-run", "rm -rf /"])
+
+        assert result.exit_code == 0
+        assert "CRITICAL" in result.stdout
 
     def test_command_with_special_chars(self, runner: CliRunner) -> None:
         """Test command with special characters."""
@@ -2,6 +2,8 @@
 Tests for safety rules.
 """
 
+import operator
+
 import pytest
 from safe_cli.core.parser import CommandParser
 from safe_cli.rules.base import RuleMatch
@@ -15,99 +17,131 @@ from safe_cli.rules.filesystem import (
 from safe_cli.utils.constants import DangerLevel
 
 
-class TestRmRule:
-    """Test suite for rm command rule."""
+@pytest.fixture(scope="module")
+def parser() -> CommandParser:
+    """Create a parser shared by the tests in this module."""
+    return CommandParser()
+
+
+@pytest.fixture(scope="module")
+def rm_rule() -> RmRule:
+    """Create an rm rule shared by the tests in this module."""
+    return RmRule()
+
+
+@pytest.fixture(scope="module")
+def mv_rule() -> MvRule:
+    """Create an mv rule shared by the tests in this module."""
+    return MvRule()
+
 
-    @pytest.fixture
-    def parser(self) -> CommandParser:
-        """Create parser instance."""
-        return CommandParser()
+@pytest.fixture(scope="module")
+def cp_rule() -> CpRule:
+    """Create a cp rule shared by the tests in this module."""
+    return CpRule()
 
-    @pytest.fixture
-    def rule(self) -> RmRule:
-        """Create rm rule instance."""
-        return RmRule()
 
-    def test_matches_rm_command(self, parser: CommandParser, rule: RmRule) -> None:
+@pytest.fixture(scope="module")
+def chmod_rule() -> ChmodRule:
+    """Create a chmod rule shared by the tests in this module."""
+    return ChmodRule()
+
+
+@pytest.fixture(scope="module")
+def chown_rule() -> ChownRule:
+    """Create a chown rule shared by the tests in this module."""
+    return ChownRule()
+
+
+class TestRmRule:
+    """Test suite for rm command rule."""
+
+    def test_matches_rm_command(self, parser: CommandParser, rm_rule: RmRule) -> None:
         """Test that rule matches rm command."""
         cmd = parser.parse("rm file.txt")
-        assert rule.matches(cmd)
+        assert rm_rule.matches(cmd)
 
     def test_does_not_match_other_commands(
-        self, parser: CommandParser, rule: RmRule
+        self, parser: CommandParser, rm_rule: RmRule
     ) -> None:
         """Test that rule doesn't match non-rm commands."""
         cmd = parser.parse("ls -la")
-        assert not rule.matches(cmd)
+        assert not rm_rule.matches(cmd)
 
-    def test_simple_rm_low_danger(self, parser: CommandParser, rule: RmRule) -> None:
+    def test_simple_rm_low_danger(self, parser: CommandParser, rm_rule: RmRule) -> None:
         """Test simple rm is low danger."""
         cmd = parser.parse("rm file.txt")
-        result = rule.analyze(cmd)
+        result = rm_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.LOW
         assert "permanently delete" in result.message.lower()
 
     def test_rm_recursive_medium_danger(
-        self, parser: CommandParser, rule: RmRule
+        self, parser: CommandParser, rm_rule: RmRule
     ) -> None:
         """Test rm -r is medium danger."""
         cmd = parser.parse("rm -r /tmp/test")
-        result = rule.analyze(cmd)
+        result = rm_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.MEDIUM
         assert "recursively" in result.message.lower()
 
-    def test_rm_force_medium_danger(self, parser: CommandParser, rule: RmRule) -> None:
+    def test_rm_force_medium_danger(
+        self, parser: CommandParser, rm_rule: RmRule
+    ) -> None:
         """Test rm -f is medium danger."""
         cmd = parser.parse("rm -f file.txt")
-        result = rule.analyze(cmd)
+        result = rm_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.MEDIUM
 
-    def test_rm_rf_high_danger(self, parser: CommandParser, rule: RmRule) -> None:
+    def test_rm_rf_high_danger(self, parser: CommandParser, rm_rule: RmRule) -> None:
         """Test rm -rf is high danger."""
         cmd = parser.parse("rm -rf /tmp/test")
-        result = rule.analyze(cmd)
+        result = rm_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.HIGH
         assert "cannot be undone" in result.message.lower()
 
-    def test_rm_rf_root_critical(self, parser: CommandParser, rule: RmRule) -> None:
+    def test_rm_rf_root_critical(self, parser: CommandParser, rm_rule: RmRule) -> None:
         """Test rm -rf on root is critical."""
         cmd = parser.parse("rm -rf /")
-        result = rule.analyze(cmd)
+        result = rm_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.CRITICAL
 
     def test_rm_rf_system_path_critical(
-        self, parser: CommandParser, rule: RmRule
+        self, parser: CommandParser, rm_rule: RmRule
     ) -> None:
         """Test rm -rf on system paths is critical."""
         cmd = parser.parse("rm -rf /usr")
-        result = rule.analyze(cmd)
+        result = rm_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.CRITICAL
 
-    def test_rm_rf_wildcard_critical(self, parser: CommandParser, rule: RmRule) -> None:
+    def test_rm_rf_wildcard_critical(
+        self, parser: CommandParser, rm_rule: RmRule
+    ) -> None:
         """Test rm -rf with wildcard is critical."""
         cmd = parser.parse("rm -rf /*")
-        result = rule.analyze(cmd)
+        result = rm_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.CRITICAL
 
-    def test_rm_suggests_interactive(self, parser: CommandParser, rule: RmRule) -> None:
+    def test_rm_suggests_interactive(
+        self, parser: CommandParser, rm_rule: RmRule
+    ) -> None:
         """Test that rm suggests interactive flag."""
         cmd = parser.parse("rm -rf /tmp/test")
-        result = rule.analyze(cmd)
+        result = rm_rule.analyze(cmd)
 
         assert result.suggestion is not None
         assert "interactive" in result.suggestion.lower()
 
-    def test_rm_safe_alternative(self, parser: CommandParser, rule: RmRule) -> None:
+    def test_rm_safe_alternative(self, parser: CommandParser, rm_rule: RmRule) -> None:
         """Test that rm provides safe alternative."""
         cmd = parser.parse("rm -rf /tmp/test")
-        result = rule.analyze(cmd)
+        result = rm_rule.analyze(cmd)
 
         assert result.safe_alternative is not None
         assert "-i" in result.safe_alternative
@@ -116,42 +150,34 @@ class TestRmRule:
 class TestMvRule:
     """Test suite for mv command rule."""
 
-    @pytest.fixture
-    def parser(self) -> CommandParser:
-        """Create parser instance."""
-        return CommandParser()
-
-    @pytest.fixture
-    def rule(self) -> MvRule:
-        """Create mv rule instance."""
-        return MvRule()
-
-    def test_matches_mv_command(self, parser: CommandParser, rule: MvRule) -> None:
+    def test_matches_mv_command(self, parser: CommandParser, mv_rule: MvRule) -> None:
         """Test that rule matches mv command."""
         cmd = parser.parse("mv old.txt new.txt")
-        assert rule.matches(cmd)
+        assert mv_rule.matches(cmd)
 
-    def test_simple_mv_low_danger(self, parser: CommandParser, rule: MvRule) -> None:
+    def test_simple_mv_low_danger(self, parser: CommandParser, mv_rule: MvRule) -> None:
         """Test simple mv is low danger."""
         cmd = parser.parse("mv old.txt new.txt")
-        result = rule.analyze(cmd)
+        result = mv_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.LOW
 
-    def test_mv_force_medium_danger(self, parser: CommandParser, rule: MvRule) -> None:
+    def test_mv_force_medium_danger(
+        self, parser: CommandParser, mv_rule: MvRule
+    ) -> None:
         """Test mv -f is medium danger."""
         cmd = parser.parse("mv -f old.txt new.txt")
-        result = rule.analyze(cmd)
+        result = mv_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.MEDIUM
         assert "overwrite" in result.message.lower()
 
     def test_mv_system_path_high_danger(
-        self, parser: CommandParser, rule: MvRule
+        self, parser: CommandParser, mv_rule: MvRule
     ) -> None:
         """Test mv on system paths is high danger."""
         cmd = parser.parse("mv -f /etc/config /tmp/")
-        result = rule.analyze(cmd)
+        result = mv_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.HIGH
         assert "system" in result.message.lower()
@@ -160,46 +186,38 @@ class TestMvRule:
 class TestCpRule:
     """Test suite for cp command rule."""
 
-    @pytest.fixture
-    def parser(self) -> CommandParser:
-        """Create parser instance."""
-        return CommandParser()
-
-    @pytest.fixture
-    def rule(self) -> CpRule:
-        """Create cp rule instance."""
-        return CpRule()
-
-    def test_matches_cp_command(self, parser: CommandParser, rule: CpRule) -> None:
+    def test_matches_cp_command(self, parser: CommandParser, cp_rule: CpRule) -> None:
         """Test that rule matches cp command."""
         cmd = parser.parse("cp file.txt backup.txt")
-        assert rule.matches(cmd)
+        assert cp_rule.matches(cmd)
 
-    def test_simple_cp_safe(self, parser: CommandParser, rule: CpRule) -> None:
+    def test_simple_cp_safe(self, parser: CommandParser, cp_rule: CpRule) -> None:
         """Test simple cp is safe."""
         cmd = parser.parse("cp file.txt backup.txt")
-        result = rule.analyze(cmd)
+        result = cp_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.SAFE
 
-    def test_cp_recursive_low_danger(self, parser: CommandParser, rule: CpRule) -> None:
+    def test_cp_recursive_low_danger(
+        self, parser: CommandParser, cp_rule: CpRule
+    ) -> None:
         """Test cp -r is low danger."""
         cmd = parser.parse("cp -r dir/ backup/")
-        result = rule.analyze(cmd)
+        result = cp_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.LOW
 
-    def test_cp_force_low_danger(self, parser: CommandParser, rule: CpRule) -> None:
+    def test_cp_force_low_danger(self, parser: CommandParser, cp_rule: CpRule) -> None:
         """Test cp -f is low danger."""
         cmd = parser.parse("cp -f file.txt backup.txt")
-        result = rule.analyze(cmd)
+        result = cp_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.LOW
 
-    def test_cp_rf_medium_danger(self, parser: CommandParser, rule: CpRule) -> None:
+    def test_cp_rf_medium_danger(self, parser: CommandParser, cp_rule: CpRule) -> None:
         """Test cp -rf is medium danger."""
         cmd = parser.parse("cp -rf dir/ backup/")
-        result = rule.analyze(cmd)
+        result = cp_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.MEDIUM
 
@@ -207,67 +225,57 @@ class TestCpRule:
 class TestChmodRule:
     """Test suite for chmod command rule."""
 
-    @pytest.fixture
-    def parser(self) -> CommandParser:
-        """Create parser instance."""
-        return CommandParser()
-
-    @pytest.fixture
-    def rule(self) -> ChmodRule:
-        """Create chmod rule instance."""
-        return ChmodRule()
-
     def test_matches_chmod_command(
-        self, parser: CommandParser, rule: ChmodRule
+        self, parser: CommandParser, chmod_rule: ChmodRule
     ) -> None:
         """Test that rule matches chmod command."""
         cmd = parser.parse("chmod 755 file.sh")
-        assert rule.matches(cmd)
+        assert chmod_rule.matches(cmd)
 
     def test_simple_chmod_low_danger(
-        self, parser: CommandParser, rule: ChmodRule
+        self, parser: CommandParser, chmod_rule: ChmodRule
     ) -> None:
         """Test simple chmod is low danger."""
         cmd = parser.parse("chmod 755 file.sh")
-        result = rule.analyze(cmd)
+        result = chmod_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.LOW
 
     def test_chmod_777_medium_danger(
-        self, parser: CommandParser, rule: ChmodRule
+        self, parser: CommandParser, chmod_rule: ChmodRule
     ) -> None:
         """Test chmod 777 is medium danger."""
         cmd = parser.parse("chmod 777 file.sh")
-        result = rule.analyze(cmd)
+        result = chmod_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.MEDIUM
         assert "security" in result.message.lower()
 
     def test_chmod_777_recursive_high_danger(
-        self, parser: CommandParser, rule: ChmodRule
+        self, parser: CommandParser, chmod_rule: ChmodRule
     ) -> None:
         """Test chmod -R 777 is high danger."""
         cmd = parser.parse("chmod -R 777 /tmp/")
-        result = rule.analyze(cmd)
+        result = chmod_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.HIGH
 
     def test_chmod_777_recursive_system_critical(
-        self, parser: CommandParser, rule: ChmodRule
+        self, parser: CommandParser, chmod_rule: ChmodRule
     ) -> None:
         """Test chmod -R 777 on system paths is critical."""
         cmd = parser.parse("chmod -R 777 /etc")
-        result = rule.analyze(cmd)
+        result = chmod_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.CRITICAL
         assert "system" in result.message.lower()
 
     def test_chmod_suggests_safer_permissions(
-        self, parser: CommandParser, rule: ChmodRule
+        self, parser: CommandParser, chmod_rule: ChmodRule
     ) -> None:
         """Test that chmod 777 suggests safer alternatives."""
         cmd = parser.parse("chmod 777 file.sh")
-        result = rule.analyze(cmd)
+        result = chmod_rule.analyze(cmd)
 
         assert result.suggestion is not None
         assert "755" in result.suggestion or "644" in result.suggestion
@@ -276,56 +284,46 @@ class TestChmodRule:
 class TestChownRule:
     """Test suite for chown command rule."""
 
-    @pytest.fixture
-    def parser(self) -> CommandParser:
-        """Create parser instance."""
-        return CommandParser()
-
-    @pytest.fixture
-    def rule(self) -> ChownRule:
-        """Create chown rule instance."""
-        return ChownRule()
-
     def test_matches_chown_command(
-        self, parser: CommandParser, rule: ChownRule
+        self, parser: CommandParser, chown_rule: ChownRule
     ) -> None:
         """Test that rule matches chown command."""
         cmd = parser.parse("chown user:group file.txt")
-        assert rule.matches(cmd)
+        assert chown_rule.matches(cmd)
 
     def test_simple_chown_low_danger(
-        self, parser: CommandParser, rule: ChownRule
+        self, parser: CommandParser, chown_rule: ChownRule
     ) -> None:
         """Test simple chown is low danger."""
         cmd = parser.parse("chown user file.txt")
-        result = rule.analyze(cmd)
+        result = chown_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.LOW
 
     def test_chown_recursive_medium_danger(
-        self, parser: CommandParser, rule: ChownRule
+        self, parser: CommandParser, chown_rule: ChownRule
     ) -> None:
         """Test chown -R is medium danger."""
         cmd = parser.parse("chown -R user /tmp/dir")
-        result = rule.analyze(cmd)
+        result = chown_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.MEDIUM
 
     def test_chown_system_path_high_danger(
-        self, parser: CommandParser, rule: ChownRule
+        self, parser: CommandParser, chown_rule: ChownRule
     ) -> None:
         """Test chown on system paths is high danger."""
         cmd = parser.parse("chown user /etc/config")
-        result = rule.analyze(cmd)
+        result = chown_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.HIGH
 
     def test_chown_recursive_system_critical(
-        self, parser: CommandParser, rule: ChownRule
+        self, parser: CommandParser, chown_rule: ChownRule
     ) -> None:
         """Test chown -R on system paths is critical."""
         cmd = parser.parse("chown -R user /usr")
-        result = rule.analyze(cmd)
+        result = chown_rule.analyze(cmd)
 
         assert result.danger_level == DangerLevel.CRITICAL
 
@@ -366,3 +364,32 @@ class TestRuleMatch:
                 danger_level=DangerLevel.LOW,
                 message="",
             )
+
+
+class TestDangerLevel:
+    """Test suite for DangerLevel ordering."""
+
+    def test_levels_are_ordered(self) -> None:
+        """Test that comparisons follow declaration order."""
+        levels = list(DangerLevel)
+        backwards = levels[::-1]
+
+        assert sorted(backwards) == levels
+        assert max(levels) == DangerLevel.CRITICAL
+        assert DangerLevel.LOW < DangerLevel.MEDIUM <= DangerLevel.MEDIUM
+        assert DangerLevel.HIGH > DangerLevel.MEDIUM >= DangerLevel.LOW
+
+    def test_comparison_with_other_types_fails(self) -> None:
+        """Test that levels don't compare with plain values."""
+        with pytest.raises(TypeError):
+            operator.lt(DangerLevel.LOW, "high")
+
+    def test_requires_confirmation(self) -> None:
+        """Test which levels require confirmation."""
+        assert [level.requires_confirmation for level in DangerLevel] == [
+            False,
+            False,
+            False,
+            True,
+            True,
+        ]
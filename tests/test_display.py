@@ -2,6 +2,8 @@
 Tests for display formatter.
 """
 
+import subprocess
+import sys
 from io import StringIO
 
 import pytest
@@ -116,6 +118,17 @@ class TestDisplayFormatter:
         output = console.file.getvalue()
         assert "rm -rf /" in output
         assert "rm -i -rf /" in output
+        assert output.endswith("┘\n\n")
+
+    def test_display_comparison_does_not_parse_markup(
+        self, formatter: DisplayFormatter, console: Console
+    ) -> None:
+        """Test that markup-like text in compared commands is shown verbatim."""
+        formatter.display_comparison("rm -rf [/x]", "rm -i -rf [/x]")
+
+        output = console.file.getvalue()
+        assert "rm -rf [/x]" in output
+        assert "rm -i -rf [/x]" in output
 
     def test_display_execution_start(
         self, formatter: DisplayFormatter, console: Console
@@ -162,6 +175,17 @@ class TestDisplayFormatter:
         assert "Error" in output or "error" in output
         assert "Test error message" in output
 
+    def test_display_error_does_not_parse_markup(
+        self, formatter: DisplayFormatter, console: Console
+    ) -> None:
+        """Test that markup-like text in error messages is shown verbatim."""
+        formatter.display_error("bad token [/x] in command")
+        formatter.display_info("x [/y]")
+
+        output = console.file.getvalue()
+        assert "bad token [/x] in command" in output
+        assert "x [/y]" in output
+
     def test_display_info(self, formatter: DisplayFormatter, console: Console) -> None:
         """Test displaying info message."""
         formatter.display_info("Test info message")
@@ -178,6 +202,69 @@ class TestDisplayFormatter:
         output = formatter.console.file.getvalue()
         assert dangerous_result.command.raw in output
 
+    def test_display_does_not_parse_command_markup(
+        self, formatter: DisplayFormatter, console: Console
+    ) -> None:
+        """Test that markup-like text in commands is shown verbatim."""
+        raw = "echo [bold]x[/bold] [/oops]"
+        cmd = ParsedCommand(raw, raw.split(), "echo", raw.split()[1:], [])
+        result = AnalysisResult(
+            command=cmd,
+            danger_level=DangerLevel.SAFE,
+            matches=(),
+            primary_warning="No issues",
+            all_warnings=(),
+            suggestions=(),
+            safe_alternatives=(),
+        )
+
+        formatter.display_analysis(result)
+        formatter.display_execution_start(raw)
+
+        assert console.file.getvalue().count(raw) == 2
+
+    @pytest.mark.parametrize("level", [DangerLevel.MEDIUM, DangerLevel.CRITICAL])
+    def test_display_does_not_parse_warning_markup(
+        self, formatter: DisplayFormatter, console: Console, level: DangerLevel
+    ) -> None:
+        """Test that markup-like text in the primary warning is shown verbatim."""
+        raw = "sudo kill [/oops]"
+        cmd = ParsedCommand(raw, raw.split(), "sudo", raw.split()[1:], [])
+        warning = f"Running '{raw}' with sudo"
+        result = AnalysisResult(
+            command=cmd,
+            danger_level=level,
+            matches=(),
+            primary_warning=warning,
+            all_warnings=(warning,),
+            suggestions=(),
+            safe_alternatives=(),
+        )
+
+        formatter.display_analysis(result)
+
+        assert warning in console.file.getvalue()
+
+    def test_display_prints_analysis_once(
+        self,
+        formatter: DisplayFormatter,
+        safe_result: AnalysisResult,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that an analysis without a panel is printed in one call."""
+        calls = []
+        print_ = formatter.console.print
+        monkeypatch.setattr(
+            formatter.console,
+            "print",
+            lambda *args, **kwargs: calls.append(args) or print_(*args, **kwargs),
+        )
+
+        formatter.display_analysis(safe_result, dry_run=True)
+
+        assert len(calls) == 1
+        assert "No safety concerns" in formatter.console.file.getvalue()
+
     def test_display_shows_danger_level(
         self, formatter: DisplayFormatter, dangerous_result: AnalysisResult
     ) -> None:
@@ -187,3 +274,25 @@ class TestDisplayFormatter:
         output = formatter.console.file.getvalue()
         assert "Danger Level" in output or "danger" in output.lower()
         assert "CRITICAL" in output
+
+
+class TestUiImports:
+    """Test that UI modules are loaded on demand."""
+
+    def test_display_does_not_load_prompts(self) -> None:
+        """Test that importing the display formatter doesn't load questionary."""
+        code = (
+            "import sys, safe_cli.ui.display; "
+            "assert 'questionary' not in sys.modules; "
+            "from safe_cli.ui import UserPrompt"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_prompts_load_questionary_on_demand(self) -> None:
+        """Test that importing the prompts doesn't load questionary."""
+        code = (
+            "import sys, safe_cli.ui.prompts; "
+            "assert 'questionary' not in sys.modules; "
+            "assert 'rich.prompt' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -13,160 +13,219 @@ from safe_cli.rules.docker import (
 from safe_cli.utils.constants import DangerLevel
 
 
-class TestDockerSystemPruneRule:
-    """Test suite for docker system prune rule."""
+@pytest.fixture(scope="module")
+def parser() -> CommandParser:
+    return CommandParser()
+
+
+@pytest.fixture(scope="module")
+def system_prune_rule() -> DockerSystemPruneRule:
+    return DockerSystemPruneRule()
+
+
+@pytest.fixture(scope="module")
+def rm_rule() -> DockerRmRule:
+    return DockerRmRule()
+
+
+@pytest.fixture(scope="module")
+def rmi_rule() -> DockerRmiRule:
+    return DockerRmiRule()
+
+
+@pytest.fixture(scope="module")
+def volume_prune_rule() -> DockerVolumePruneRule:
+    return DockerVolumePruneRule()
 
-    @pytest.fixture
-    def parser(self) -> CommandParser:
-        return CommandParser()
 
-    @pytest.fixture
-    def rule(self) -> DockerSystemPruneRule:
-        return DockerSystemPruneRule()
+class TestDockerSystemPruneRule:
+    """Test suite for docker system prune rule."""
 
     def test_matches_system_prune(
-        self, parser: CommandParser, rule: DockerSystemPruneRule
+        self, parser: CommandParser, system_prune_rule: DockerSystemPruneRule
     ) -> None:
         cmd = parser.parse("docker system prune")
-        assert rule.matches(cmd)
+        assert system_prune_rule.matches(cmd)
 
     def test_prune_all_volumes_critical(
-        self, parser: CommandParser, rule: DockerSystemPruneRule
+        self, parser: CommandParser, system_prune_rule: DockerSystemPruneRule
     ) -> None:
         cmd = parser.parse("docker system prune -a --volumes")
-        result = rule.analyze(cmd)
+        result = system_prune_rule.analyze(cmd)
+        assert result.danger_level == DangerLevel.CRITICAL
+
+    def test_prune_all_volumes_force_stays_critical(
+        self, parser: CommandParser, system_prune_rule: DockerSystemPruneRule
+    ) -> None:
+        cmd = parser.parse("docker system prune -a --volumes --force")
+        result = system_prune_rule.analyze(cmd)
         assert result.danger_level == DangerLevel.CRITICAL
+        assert result.safe_alternative == "docker system prune -a --volumes"
 
     def test_prune_all_high(
-        self, parser: CommandParser, rule: DockerSystemPruneRule
+        self, parser: CommandParser, system_prune_rule: DockerSystemPruneRule
     ) -> None:
         cmd = parser.parse("docker system prune -a")
-        result = rule.analyze(cmd)
+        result = system_prune_rule.analyze(cmd)
         assert result.danger_level == DangerLevel.HIGH
 
     def test_prune_volumes_high(
-        self, parser: CommandParser, rule: DockerSystemPruneRule
+        self, parser: CommandParser, system_prune_rule: DockerSystemPruneRule
     ) -> None:
         cmd = parser.parse("docker system prune --volumes")
-        result = rule.analyze(cmd)
+        result = system_prune_rule.analyze(cmd)
         assert result.danger_level == DangerLevel.HIGH
 
     def test_prune_basic_medium(
-        self, parser: CommandParser, rule: DockerSystemPruneRule
+        self, parser: CommandParser, system_prune_rule: DockerSystemPruneRule
     ) -> None:
         cmd = parser.parse("docker system prune")
-        result = rule.analyze(cmd)
+        result = system_prune_rule.analyze(cmd)
         assert result.danger_level == DangerLevel.MEDIUM
 
 
 class TestDockerRmRule:
     """Test suite for docker rm rule."""
 
-    @pytest.fixture
-    def parser(self) -> CommandParser:
-        return CommandParser()
-
-    @pytest.fixture
-    def rule(self) -> DockerRmRule:
-        return DockerRmRule()
-
-    def test_matches_docker_rm(self, parser: CommandParser, rule: DockerRmRule) -> None:
+    def test_matches_docker_rm(
+        self, parser: CommandParser, rm_rule: DockerRmRule
+    ) -> None:
         cmd = parser.parse("docker rm container")
-        assert rule.matches(cmd)
+        assert rm_rule.matches(cmd)
 
     def test_rm_force_volumes_multiple_critical(
-        self, parser: CommandParser, rule: DockerRmRule
+        self, parser: CommandParser, rm_rule: DockerRmRule
     ) -> None:
         cmd = parser.parse("docker rm -fv container1 container2")
-        result = rule.analyze(cmd)
+        result = rm_rule.analyze(cmd)
         assert result.danger_level == DangerLevel.CRITICAL
 
     def test_rm_force_multiple_high(
-        self, parser: CommandParser, rule: DockerRmRule
+        self, parser: CommandParser, rm_rule: DockerRmRule
     ) -> None:
         cmd = parser.parse("docker rm -f container1 container2")
-        result = rule.analyze(cmd)
+        result = rm_rule.analyze(cmd)
         assert result.danger_level == DangerLevel.HIGH
 
-    def test_rm_volumes_high(self, parser: CommandParser, rule: DockerRmRule) -> None:
+    def test_rm_volumes_high(
+        self, parser: CommandParser, rm_rule: DockerRmRule
+    ) -> None:
         cmd = parser.parse("docker rm -v container")
-        result = rule.analyze(cmd)
+        result = rm_rule.analyze(cmd)
         assert result.danger_level == DangerLevel.HIGH
 
-    def test_rm_force_medium(self, parser: CommandParser, rule: DockerRmRule) -> None:
+    def test_rm_volumes_alternative(
+        self, parser: CommandParser, rm_rule: DockerRmRule
+    ) -> None:
+        cmd = parser.parse("docker rm --volumes web-vol")
+        result = rm_rule.analyze(cmd)
+        assert result.safe_alternative == "docker rm web-vol"
+
+    def test_rm_force_medium(
+        self, parser: CommandParser, rm_rule: DockerRmRule
+    ) -> None:
         cmd = parser.parse("docker rm -f container")
-        result = rule.analyze(cmd)
+        result = rm_rule.analyze(cmd)
         assert result.danger_level == DangerLevel.MEDIUM
+        assert result.safe_alternative == "docker stop container"
+
+    def test_rm_force_volumes_single_high(
+        self, parser: CommandParser, rm_rule: DockerRmRule
+    ) -> None:
+        cmd = parser.parse("docker rm -f -v container")
+        result = rm_rule.analyze(cmd)
+        assert result.danger_level == DangerLevel.HIGH
+        assert result.safe_alternative == "docker rm -f container"
 
-    def test_rm_basic_low(self, parser: CommandParser, rule: DockerRmRule) -> None:
+    def test_rm_basic_low(self, parser: CommandParser, rm_rule: DockerRmRule) -> None:
         cmd = parser.parse("docker rm container")
-        result = rule.analyze(cmd)
+        result = rm_rule.analyze(cmd)
         assert result.danger_level == DangerLevel.LOW
 
 
 class TestDockerRmiRule:
     """Test suite for docker rmi rule."""
 
-    @pytest.fixture
-    def parser(self) -> CommandParser:
-        return CommandParser()
-
-    @pytest.fixture
-    def rule(self) -> DockerRmiRule:
-        return DockerRmiRule()
-
     def test_matches_docker_rmi(
-        self, parser: CommandParser, rule: DockerRmiRule
+        self, parser: CommandParser, rmi_rule: DockerRmiRule
     ) -> None:
         cmd = parser.parse("docker rmi image")
-        assert rule.matches(cmd)
+        assert rmi_rule.matches(cmd)
 
     def test_rmi_force_multiple_high(
-        self, parser: CommandParser, rule: DockerRmiRule
+        self, parser: CommandParser, rmi_rule: DockerRmiRule
     ) -> None:
         cmd = parser.parse("docker rmi -f image1 image2")
-        result = rule.analyze(cmd)
+        result = rmi_rule.analyze(cmd)
         assert result.danger_level == DangerLevel.HIGH
 
-    def test_rmi_force_medium(self, parser: CommandParser, rule: DockerRmiRule) -> None:
+    def test_rmi_force_medium(
+        self, parser: CommandParser, rmi_rule: DockerRmiRule
+    ) -> None:
         cmd = parser.parse("docker rmi -f image")
-        result = rule.analyze(cmd)
+        result = rmi_rule.analyze(cmd)
         assert result.danger_level == DangerLevel.MEDIUM
 
+    def test_rmi_force_alternative_drops_whole_flag(
+        self, parser: CommandParser, rmi_rule: DockerRmiRule
+    ) -> None:
+        cmd = parser.parse("docker rmi --force my-image")
+        result = rmi_rule.analyze(cmd)
+        assert result.safe_alternative == "docker rmi my-image"
+
     def test_rmi_multiple_medium(
-        self, parser: CommandParser, rule: DockerRmiRule
+        self, parser: CommandParser, rmi_rule: DockerRmiRule
     ) -> None:
         cmd = parser.parse("docker rmi image1 image2 image3")
-        result = rule.analyze(cmd)
+        result = rmi_rule.analyze(cmd)
         assert result.danger_level == DangerLevel.MEDIUM
 
-    def test_rmi_basic_low(self, parser: CommandParser, rule: DockerRmiRule) -> None:
+    def test_rmi_basic_low(
+        self, parser: CommandParser, rmi_rule: DockerRmiRule
+    ) -> None:
         cmd = parser.parse("docker rmi image")
-        result = rule.analyze(cmd)
+        result = rmi_rule.analyze(cmd)
         assert result.danger_level == DangerLevel.LOW
 
+    def test_rmi_basic_result_shared(
+        self, parser: CommandParser, rmi_rule: DockerRmiRule
+    ) -> None:
+        first = rmi_rule.analyze(parser.parse("docker rmi image"))
+        second = rmi_rule.analyze(parser.parse("docker rmi other"))
+        assert first is second
+
 
 class TestDockerVolumePruneRule:
     """Test suite for docker volume prune rule."""
 
-    @pytest.fixture
-    def parser(self) -> CommandParser:
-        return CommandParser()
-
-    @pytest.fixture
-    def rule(self) -> DockerVolumePruneRule:
-        return DockerVolumePruneRule()
-
     def test_matches_volume_prune(
-        self, parser: CommandParser, rule: DockerVolumePruneRule
+        self, parser: CommandParser, volume_prune_rule: DockerVolumePruneRule
     ) -> None:
         cmd = parser.parse("docker volume prune")
-        assert rule.matches(cmd)
+        assert volume_prune_rule.matches(cmd)
 
     def test_volume_prune_critical(
-        self, parser: CommandParser, rule: DockerVolumePruneRule
+        self, parser: CommandParser, volume_prune_rule: DockerVolumePruneRule
     ) -> None:
         cmd = parser.parse("docker volume prune -f")
-        result = rule.analyze(cmd)
+        result = volume_prune_rule.analyze(cmd)
         assert result.danger_level == DangerLevel.CRITICAL
         assert "permanently" in result.message.lower()
+
+    def test_volume_prune_combined_force_flag(
+        self, parser: CommandParser, volume_prune_rule: DockerVolumePruneRule
+    ) -> None:
+        cmd = parser.parse("docker volume prune -af")
+        result = volume_prune_rule.analyze(cmd)
+        assert result.danger_level == DangerLevel.CRITICAL
+
+    def test_volume_prune_without_force_shared(
+        self, parser: CommandParser, volume_prune_rule: DockerVolumePruneRule
+    ) -> None:
+        first = volume_prune_rule.analyze(parser.parse("docker volume prune"))
+        second = volume_prune_rule.analyze(
+            parser.parse("docker volume prune --filter label=x")
+        )
+        assert first.danger_level == DangerLevel.HIGH
+        assert first.safe_alternative == "docker volume ls"
+        assert first is second
@@ -2,7 +2,10 @@
 Tests for command executor.
 """
 
+import selectors
+
 import pytest
+from safe_cli.core import executor as executor_module
 from safe_cli.core.executor import CommandExecutor, ExecutionResult
 
 
@@ -71,6 +74,16 @@ class TestCommandExecutor:
 
         assert result.stderr or "error" in result.stdout  # Shell dependent
 
+    def test_execute_without_capture(
+        self, executor: CommandExecutor, capfd: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that uncaptured output goes straight to the terminal."""
+        result = executor.execute("echo streamed", capture=False)
+
+        assert result.success
+        assert result.stdout == ""
+        assert "streamed" in capfd.readouterr().out
+
     def test_execution_result_output_property(self, executor: CommandExecutor) -> None:
         """Test that output property combines stdout and stderr."""
         result = executor.execute("echo test")
@@ -234,3 +247,31 @@ class TestCommandExecutorRealtime:
 
         assert not result.success
         assert result.error
+
+    def test_realtime_streaming_error_returns_failure(
+        self, executor: CommandExecutor, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that errors while streaming come back as a failed result."""
+
+        def broken_selector() -> selectors.BaseSelector:
+            raise OSError("pipes can't be selected")
+
+        monkeypatch.setattr(selectors, "DefaultSelector", broken_selector)
+        result = executor.execute_with_realtime_output("echo test")
+
+        assert not result.success
+        assert result.error == "pipes can't be selected"
+
+    def test_realtime_without_selectable_pipes(
+        self, executor: CommandExecutor, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that output is still collected where pipes can't be selected."""
+        monkeypatch.setattr(executor_module, "_CAN_SELECT_PIPES", False)
+
+        result = executor.execute_with_realtime_output("echo test")
+        assert result.success
+        assert "test" in result.stdout
+
+        result = executor.execute_with_realtime_output("sleep 10", timeout=1)
+        assert not result.success
+        assert result.error
@@ -113,6 +113,17 @@ class TestGitPushForceRule:
         result = rule.analyze(cmd)
         assert result.danger_level == DangerLevel.HIGH
 
+    def test_force_alternative_rewrites_whole_flag(
+        self, parser: CommandParser, rule: GitPushForceRule
+    ) -> None:
+        result = rule.analyze(parser.parse("git push --force origin main"))
+        assert result.safe_alternative == "git push --force-with-lease origin main"
+
+        result = rule.analyze(parser.parse("git push -f origin feature-fix"))
+        assert (
+            result.safe_alternative == "git push --force-with-lease origin feature-fix"
+        )
+
 
 class TestGitCleanRule:
     """Test suite for git clean rule."""
@@ -153,6 +164,14 @@ class TestGitCleanRule:
         result = rule.analyze(cmd)
         assert result.danger_level == DangerLevel.LOW
 
+    def test_git_clean_fx_medium(
+        self, parser: CommandParser, rule: GitCleanRule
+    ) -> None:
+        result = rule.analyze(parser.parse("git clean -f -x"))
+        assert result.danger_level == DangerLevel.MEDIUM
+        assert result.safe_alternative == "git clean -fn"
+        assert result is rule.analyze(parser.parse("git clean -f"))
+
 
 class TestGitBranchDeleteRule:
     """Test suite for git branch -D rule."""
@@ -184,3 +203,9 @@ class TestGitBranchDeleteRule:
         result = rule.analyze(cmd)
         assert result.danger_level == DangerLevel.HIGH
         assert "unmerged" in result.message.lower()
+
+    def test_alternative_keeps_branch_name(
+        self, parser: CommandParser, rule: GitBranchDeleteRule
+    ) -> None:
+        result = rule.analyze(parser.parse("git branch -D fix-D-option"))
+        assert result.safe_alternative == "git branch -d fix-D-option"
@@ -2,6 +2,8 @@
 Tests for command parser.
 """
 
+import shlex
+
 import pytest
 from safe_cli.core.parser import CommandParser, ParsedCommand
 
@@ -19,9 +21,9 @@ class TestCommandParser:
         result = parser.parse("ls")
 
         assert result.command == "ls"
-        assert result.args == []
-        assert result.flags == []
-        assert result.tokens == ["ls"]
+        assert result.args == ()
+        assert result.flags == ()
+        assert result.tokens == ("ls",)
         assert result.raw == "ls"
 
     def test_command_with_args(self, parser: CommandParser) -> None:
@@ -29,25 +31,25 @@ class TestCommandParser:
         result = parser.parse("rm file.txt")
 
         assert result.command == "rm"
-        assert result.args == ["file.txt"]
-        assert result.flags == []
-        assert result.tokens == ["rm", "file.txt"]
+        assert result.args == ("file.txt",)
+        assert result.flags == ()
+        assert result.tokens == ("rm", "file.txt")
 
     def test_command_with_flags(self, parser: CommandParser) -> None:
         """Test parsing command with flags."""
         result = parser.parse("ls -la")
 
         assert result.command == "ls"
-        assert result.flags == ["-la"]
-        assert result.args == []
+        assert result.flags == ("-la",)
+        assert result.args == ()
 
     def test_command_with_flags_and_args(self, parser: CommandParser) -> None:
         """Test parsing command with both flags and arguments."""
         result = parser.parse("rm -rf /tmp/test")
 
         assert result.command == "rm"
-        assert result.flags == ["-rf"]
-        assert result.args == ["/tmp/test"]
+        assert result.flags == ("-rf",)
+        assert result.args == ("/tmp/test",)
         assert len(result.tokens) == 3
 
     def test_command_with_multiple_flags(self, parser: CommandParser) -> None:
@@ -64,7 +66,7 @@ class TestCommandParser:
         result = parser.parse('echo "hello world"')
 
         assert result.command == "echo"
-        assert result.args == ["hello world"]
+        assert result.args == ("hello world",)
         assert len(result.tokens) == 2
 
     def test_command_with_escaped_spaces(self, parser: CommandParser) -> None:
@@ -72,7 +74,7 @@ class TestCommandParser:
         result = parser.parse(r"rm my\ file.txt")
 
         assert result.command == "rm"
-        assert result.args == ["my file.txt"]
+        assert result.args == ("my file.txt",)
 
     def test_empty_command_raises_error(self, parser: CommandParser) -> None:
         """Test that empty command raises ValueError."""
@@ -89,6 +91,50 @@ class TestCommandParser:
         with pytest.raises(ValueError, match="Invalid command syntax"):
             parser.parse('echo "unclosed quote')
 
+    def test_unquoted_command_matches_shlex(self, parser: CommandParser) -> None:
+        """Test that unquoted commands tokenize exactly like shlex."""
+        command = "  rm\t-rf  /tmp/build\n dist#1 "
+        result = parser.parse(command)
+
+        assert result.tokens == tuple(shlex.split(command))
+        assert result.raw == command
+
+    def test_parse_tokens(self, parser: CommandParser) -> None:
+        """Test building a command from argv without re-splitting it."""
+        result = parser.parse_tokens(["git", "commit", "-m", "fix: it's done"])
+
+        assert result.command == "git"
+        assert result.flags == ("-m",)
+        assert result.args == ("commit", "fix: it's done")
+        assert shlex.split(result.raw) == list(result.tokens)
+
+    def test_parse_tokens_empty_raises_error(self, parser: CommandParser) -> None:
+        """Test that an empty token list raises ValueError."""
+        with pytest.raises(ValueError, match="Command cannot be empty"):
+            parser.parse_tokens([])
+
+    def test_parsed_command_is_immutable(self, parser: CommandParser) -> None:
+        """Test that parsed commands are frozen and hashable."""
+        result = parser.parse("rm -rf /tmp")
+
+        with pytest.raises(AttributeError):
+            result.command = "ls"  # type: ignore[misc]
+        assert hash(result) == hash(parser.parse("rm -rf /tmp"))
+        assert result == ParsedCommand(
+            "rm -rf /tmp", ["rm", "-rf", "/tmp"], "rm", ["/tmp"], ["-rf"]
+        )
+
+    def test_repeated_parse_reuses_result(self, parser: CommandParser) -> None:
+        """Test that parsing the same text twice shares one ParsedCommand."""
+        assert parser.parse("git status") is CommandParser().parse("git status")
+
+    def test_arg_set(self, parser: CommandParser) -> None:
+        """Test that arguments are exposed as a frozenset."""
+        result = parser.parse("git push origin main -f")
+
+        assert result.arg_set == frozenset({"push", "origin", "main"})
+        assert result.arg_set is result.arg_set
+
     def test_has_flag(self, parser: CommandParser) -> None:
         """Test has_flag method."""
         result = parser.parse("rm -rf /tmp")
@@ -104,6 +150,24 @@ class TestCommandParser:
         assert result.has_any_flag(["-r", "-rf"])
         assert not result.has_any_flag(["-i", "-v"])
 
+    def test_has_flag_combined_short_flags(self, parser: CommandParser) -> None:
+        """Test that combined short flags match each of their letters."""
+        result = parser.parse("rm -rf /tmp")
+
+        assert result.has_flag("-r")
+        assert result.has_flag("-f")
+        assert not result.has_flag("-R")
+        assert not result.has_flag("--recursive")
+
+    def test_has_flag_long_flags(self, parser: CommandParser) -> None:
+        """Test long flag matching, including the --flag=value form."""
+        result = parser.parse("git push --force-with-lease --output=log.txt")
+
+        assert result.has_flag("--force-with-lease")
+        assert result.has_flag("--output")
+        assert not result.has_flag("--force")
+        assert not result.has_flag("-f")
+
     def test_get_flag_value_with_equals(self, parser: CommandParser) -> None:
         """Test getting flag value with = syntax."""
         result = parser.parse("command --output=file.txt")
@@ -117,6 +181,12 @@ class TestCommandParser:
         assert parser.is_compound_command("cat file > output.txt")
         assert not parser.is_compound_command("ls -la")
 
+    def test_is_compound_command_operators(self, parser: CommandParser) -> None:
+        """Test each compound operator, and that a lone '&' isn't one."""
+        for command in ("a || b", "a; b", "a >> log", "sort < in.txt"):
+            assert parser.is_compound_command(command)
+        assert not parser.is_compound_command("sleep 10 &")
+
     def test_split_compound_command(self, parser: CommandParser) -> None:
         """Test splitting compound commands."""
         parts = parser.split_compound_command("ls | grep test")
@@ -2,6 +2,9 @@
 Tests for rule registry.
 """
 
+import subprocess
+import sys
+
 import pytest
 from safe_cli.core.parser import CommandParser
 from safe_cli.rules.base import Rule, RuleMatch
@@ -90,6 +93,20 @@ class TestRuleRegistry:
         assert result is True
         assert registry.get_rule("dummy_rule") is None
 
+    def test_reregister_after_unregister(self, registry: RuleRegistry) -> None:
+        """Test that a name is free again once its rule is unregistered."""
+        registry.unregister("rm_command")
+        registry.register(RmRule())
+
+        assert isinstance(registry.get_rule("rm_command"), RmRule)
+
+    def test_register_after_clear(self, registry: RuleRegistry) -> None:
+        """Test that clearing forgets rule names."""
+        registry.clear()
+        registry.register(RmRule())
+
+        assert len(registry) == 1
+
     def test_unregister_nonexistent_rule(self, registry: RuleRegistry) -> None:
         """Test unregistering nonexistent rule returns False."""
         result = registry.unregister("nonexistent")
@@ -102,6 +119,12 @@ class TestRuleRegistry:
         assert rule is not None
         assert isinstance(rule, RmRule)
 
+    def test_default_rules_shared_between_registries(
+        self, registry: RuleRegistry
+    ) -> None:
+        """Test that registries reuse the same default rule instances."""
+        assert registry.get_rule("rm_command") is RuleRegistry().get_rule("rm_command")
+
     def test_get_nonexistent_rule(self, registry: RuleRegistry) -> None:
         """Test getting nonexistent rule returns None."""
         rule = registry.get_rule("nonexistent")
@@ -163,6 +186,50 @@ class TestRuleRegistry:
 
         assert danger == DangerLevel.CRITICAL
 
+    def test_get_highest_danger_level_stops_at_critical(
+        self, parser: CommandParser
+    ) -> None:
+        """Test that rules after a CRITICAL match aren't analyzed."""
+        calls = []
+
+        class RecordingRule(DummyRule):
+            triggers = ("rm",)
+
+            def matches(self, command):
+                calls.append(command.raw)
+                return True
+
+        registry = RuleRegistry()
+        registry.register(RecordingRule())
+
+        assert registry.get_highest_danger_level(parser.parse("rm -rf /")) == (
+            DangerLevel.CRITICAL
+        )
+        assert calls == []
+
+    def test_get_highest_danger_level_stop_at(self, parser: CommandParser) -> None:
+        """Test that analysis stops once the requested level is reached."""
+        calls = []
+
+        class RecordingRule(DummyRule):
+            triggers = ("rm",)
+
+            def matches(self, command):
+                calls.append(command.raw)
+                return True
+
+        registry = RuleRegistry()
+        registry.register(RecordingRule())
+        cmd = parser.parse("rm file.txt")
+
+        assert registry.get_highest_danger_level(cmd, stop_at=DangerLevel.LOW) == (
+            DangerLevel.LOW
+        )
+        assert calls == []
+
+        registry.get_highest_danger_level(cmd)
+        assert calls == ["rm file.txt"]
+
     def test_get_highest_danger_level_no_match(
         self, registry: RuleRegistry, parser: CommandParser
     ) -> None:
@@ -215,3 +282,105 @@ class TestRuleRegistry:
         assert len(matches) >= 2
         assert any(r.name == "rm_command" for r in matches)
         assert any(r.name == "another_rm_rule" for r in matches)
+
+    def test_untriggered_rule_checked_for_every_command(
+        self, registry: RuleRegistry, parser: CommandParser
+    ) -> None:
+        """Test that rules without triggers are still consulted."""
+        registry.register(DummyRule())
+
+        matches = registry.find_matching_rules(parser.parse("dummy --flag"))
+
+        assert [r.name for r in matches] == ["dummy_rule"]
+
+    def test_triggered_rule_skipped_for_other_commands(
+        self, registry: RuleRegistry, parser: CommandParser
+    ) -> None:
+        """Test that rules are only consulted for their trigger commands."""
+        calls = []
+
+        class TriggeredRule(DummyRule):
+            name = "triggered_rule"
+            triggers = ("dummy",)
+
+            def matches(self, command):
+                calls.append(command.command)
+                return super().matches(command)
+
+        registry.register(TriggeredRule())
+        registry.find_matching_rules(parser.parse("ls -la"))
+        matches = registry.find_matching_rules(parser.parse("dummy"))
+
+        assert calls == ["dummy"]
+        assert [r.name for r in matches] == ["triggered_rule"]
+
+    def test_trigger_args_skip_rule_without_subcommand(
+        self, registry: RuleRegistry, parser: CommandParser
+    ) -> None:
+        """Test that rules are only consulted when their trigger args appear."""
+        calls = []
+
+        class SubcommandRule(DummyRule):
+            name = "subcommand_rule"
+            triggers = ("dummy",)
+            trigger_args = ("system", "prune")
+
+            def matches(self, command):
+                calls.append(command.raw)
+                return super().matches(command)
+
+        registry.register(SubcommandRule())
+        registry.find_matching_rules(parser.parse("dummy system df"))
+        matches = registry.find_matching_rules(parser.parse("dummy prune system"))
+
+        assert calls == ["dummy prune system"]
+        assert [r.name for r in matches] == ["subcommand_rule"]
+
+    def test_prefix_triggered_rule(
+        self, registry: RuleRegistry, parser: CommandParser
+    ) -> None:
+        """Test that prefix triggers match command name variants."""
+        matches = registry.find_matching_rules(parser.parse("mkfs.ext4 /dev/sdb1"))
+
+        assert [r.name for r in matches] == ["mkfs_command"]
+
+    def test_unregister_removes_rule_from_matching(
+        self, registry: RuleRegistry, parser: CommandParser
+    ) -> None:
+        """Test that unregistered rules no longer match."""
+        registry.unregister("rm_command")
+
+        matches = registry.find_matching_rules(parser.parse("rm -rf /"))
+
+        assert matches == []
+
+    def test_has_candidates(self, registry: RuleRegistry) -> None:
+        """Test the command name pre-filter."""
+        assert registry.has_candidates("rm")
+        assert registry.has_candidates("git")
+        assert registry.has_candidates("mkfs.vfat")
+        assert not registry.has_candidates("ls")
+
+    def test_has_candidates_with_untriggered_rule(self, registry: RuleRegistry) -> None:
+        """Test that rules without triggers disable the pre-filter."""
+        registry.register(DummyRule())
+
+        assert registry.has_candidates("ls")
+
+
+class TestImportOrder:
+    """Test that the rules package can be imported on its own."""
+
+    @pytest.mark.parametrize("module", ["safe_cli.rules", "safe_cli.rules.registry"])
+    def test_rules_importable_first(self, module: str) -> None:
+        """Test that rule modules import cleanly in a fresh interpreter."""
+        subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+
+    def test_rule_modules_loaded_on_demand(self) -> None:
+        """Test that importing the base classes doesn't load every rule module."""
+        code = (
+            "import sys, safe_cli.rules.base; "
+            "assert 'safe_cli.rules.docker' not in sys.modules; "
+            "from safe_cli.rules import DockerRmRule"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
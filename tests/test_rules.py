@@ -4,7 +4,7 @@ Tests for safety rules.
 
 import pytest
 from safe_cli.core.parser import CommandParser
-from safe_cli.rules.base import RuleMatch
+from safe_cli.rules.base import CompositeRule, RuleMatch
 from safe_cli.rules.filesystem import (
     ChmodRule,
     ChownRule,
@@ -89,6 +89,20 @@ class TestRmRule:
 
         assert result.danger_level == DangerLevel.CRITICAL
 
+    def test_rm_system_path_prefix_boundaries(
+        self, parser: CommandParser, rule: RmRule
+    ) -> None:
+        """Test that only exact system paths and their sub-paths are dangerous."""
+        assert rule.analyze(parser.parse("rm /etc/hosts")).danger_level == (
+            DangerLevel.HIGH
+        )
+        assert rule.analyze(parser.parse("rm /etcetera")).danger_level == (
+            DangerLevel.LOW
+        )
+        assert rule.analyze(parser.parse("rm /tmp/file")).danger_level == (
+            DangerLevel.LOW
+        )
+
     def test_rm_rf_wildcard_critical(self, parser: CommandParser, rule: RmRule) -> None:
         """Test rm -rf with wildcard is critical."""
         cmd = parser.parse("rm -rf /*")
@@ -112,6 +126,15 @@ class TestRmRule:
         assert result.safe_alternative is not None
         assert "-i" in result.safe_alternative
 
+    def test_rm_safe_alternative_without_flags(
+        self, parser: CommandParser, rule: RmRule
+    ) -> None:
+        """Test that the rm alternative is single-spaced when there are no flags."""
+        result = rule.analyze(parser.parse("rm notes.txt"))
+
+        assert result.safe_alternative == "rm -i notes.txt"
+        assert result.message == "This will permanently delete files."
+
 
 class TestMvRule:
     """Test suite for mv command rule."""
@@ -156,6 +179,14 @@ class TestMvRule:
         assert result.danger_level == DangerLevel.HIGH
         assert "system" in result.message.lower()
 
+    def test_mv_safe_alternative_without_flags(
+        self, parser: CommandParser, rule: MvRule
+    ) -> None:
+        """Test that the mv alternative is single-spaced when there are no flags."""
+        result = rule.analyze(parser.parse("mv /etc/hosts /tmp/"))
+
+        assert result.safe_alternative == "mv -i /etc/hosts /tmp/"
+
 
 class TestCpRule:
     """Test suite for cp command rule."""
@@ -182,6 +213,14 @@ class TestCpRule:
 
         assert result.danger_level == DangerLevel.SAFE
 
+    def test_cp_safe_result_shared(self, parser: CommandParser, rule: CpRule) -> None:
+        """Test that plain copies share one result."""
+        first = rule.analyze(parser.parse("cp a.txt b.txt"))
+        second = rule.analyze(parser.parse("cp c.txt d.txt"))
+
+        assert first.danger_level == DangerLevel.SAFE
+        assert first is second
+
     def test_cp_recursive_low_danger(self, parser: CommandParser, rule: CpRule) -> None:
         """Test cp -r is low danger."""
         cmd = parser.parse("cp -r dir/ backup/")
@@ -358,6 +397,17 @@ class TestRuleMatch:
                 message="Test",
             )
 
+    def test_rule_match_is_immutable(self) -> None:
+        """Test that rule matches can't be modified once created."""
+        match = RuleMatch(
+            rule_name="test",
+            danger_level=DangerLevel.LOW,
+            message="Test",
+        )
+
+        with pytest.raises(AttributeError):
+            match.danger_level = DangerLevel.CRITICAL  # type: ignore[misc]
+
     def test_rule_match_requires_message(self) -> None:
         """Test that rule match requires message."""
         with pytest.raises(ValueError):
@@ -366,3 +416,53 @@ class TestRuleMatch:
                 danger_level=DangerLevel.LOW,
                 message="",
             )
+
+
+class TestCompositeRule:
+    """Test suite for composite rules."""
+
+    @pytest.fixture
+    def parser(self) -> CommandParser:
+        """Create parser instance."""
+        return CommandParser()
+
+    @pytest.fixture
+    def rule(self) -> CompositeRule:
+        """Create composite of rm and chmod rules."""
+        return CompositeRule([RmRule(), ChmodRule()])
+
+    def test_analyze_if_matches_non_matching(
+        self, parser: CommandParser, rule: CompositeRule
+    ) -> None:
+        """Test that a command no sub-rule matches yields None."""
+        assert rule.analyze_if_matches(parser.parse("ls -la")) is None
+
+    def test_analyze_non_matching_is_safe(
+        self, parser: CommandParser, rule: CompositeRule
+    ) -> None:
+        """Test that analyze still reports SAFE when nothing matches."""
+        result = rule.analyze(parser.parse("ls -la"))
+        assert result.danger_level == DangerLevel.SAFE
+
+    def test_analyze_uses_matching_sub_rule(
+        self, parser: CommandParser, rule: CompositeRule
+    ) -> None:
+        """Test that the matching sub-rule's result is returned."""
+        result = rule.analyze(parser.parse("rm -rf /"))
+        assert result.rule_name == RmRule.name
+        assert result.danger_level == DangerLevel.CRITICAL
+
+    def test_stops_after_critical_match(self, parser: CommandParser) -> None:
+        """Test that sub-rules after a CRITICAL match aren't analyzed."""
+        calls = []
+
+        class RecordingRule(ChmodRule):
+            def analyze_if_matches(self, command):
+                calls.append(command.raw)
+                return super().analyze_if_matches(command)
+
+        rule = CompositeRule([RmRule(), RecordingRule()])
+        result = rule.analyze(parser.parse("rm -rf /"))
+
+        assert result.danger_level == DangerLevel.CRITICAL
+        assert calls == []
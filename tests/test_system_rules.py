@@ -112,6 +112,13 @@ class TestKillRule:
         result = rule.analyze(cmd)
         assert result.danger_level == DangerLevel.CRITICAL
 
+    def test_kill_9_system_process_names_targets(
+        self, parser: CommandParser, rule: KillRule
+    ) -> None:
+        cmd = parser.parse("killall -9 sshd init")
+        result = rule.analyze(cmd)
+        assert "like sshd, init can crash" in result.message
+
     def test_killall_9_high(self, parser: CommandParser, rule: KillRule) -> None:
         cmd = parser.parse("killall -9 firefox")
         result = rule.analyze(cmd)